@@ -0,0 +1,141 @@
+"""ETags and Last-Modified dates of the public data endpoints.
+
+They are computed without building the response body, so that conditional
+requests can be answered with 304 Not Modified. Both depend on the language,
+since the data contains labels.
+"""
+import hashlib
+import json
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.db.models import Count, F, Max, OuterRef, Q, Subquery, TextField
+from django.db.models.functions import MD5, Cast, Concat
+from django.utils.translation import get_language
+
+from core.categories import CATEGORIES
+from core.models import ALL_USERS, Entry, get_user_data_generations, user_data_cache
+from core.skosmos import label_cache
+from media_server.models import Media
+
+
+def make_etag(*parts):
+    data = json.dumps(
+        [get_language() or 'en', label_cache.version, *parts], default=str
+    )
+    return hashlib.sha1(data.encode()).hexdigest()  # nosec
+
+
+def user_data_etag(request, pk=None, *args, **kwargs):
+    names = {ALL_USERS, pk}
+    for c in CATEGORIES:
+        names.update(get_user_data_generations(pk, c))
+    names = sorted(names)
+    return make_etag(
+        pk,
+        request.query_params.get('all', 'false'),
+        user_data_cache.get_generations(names),
+    )
+
+
+def get_entry_version(request, **filters):
+    """Return the version of the public data of a published entry.
+
+    The version is fetched with a single query and kept on the request, so
+    that it is shared by the ETag and the Last-Modified date. It is None if
+    the entry does not exist.
+    """
+    if not hasattr(request, '_entry_version'):
+        published_media = (
+            Media.objects.filter(entry_id=OuterRef('pk'), published=True)
+            .order_by()
+            .values('entry_id')
+        )
+        request._entry_version = (
+            Entry.objects.filter(published=True, **filters)
+            .annotate(
+                media_modified=Subquery(
+                    published_media.annotate(v=Max('modified')).values('v')
+                ),
+                # media might also be reordered or featured without changing
+                # their modification date
+                media_version=Subquery(
+                    published_media.annotate(
+                        v=MD5(
+                            StringAgg(
+                                Concat(
+                                    F('id'),
+                                    Cast('modified', TextField()),
+                                    Cast('order', TextField()),
+                                    Cast('featured', TextField()),
+                                    output_field=TextField(),
+                                ),
+                                ',',
+                                ordering='id',
+                            )
+                        )
+                    ).values('v')
+                ),
+                to_changed=Max(
+                    'relations__date_changed', filter=Q(relations__published=True)
+                ),
+                to_count=Count(
+                    'relations', filter=Q(relations__published=True), distinct=True
+                ),
+                parents_changed=Max(
+                    'related_to__date_changed', filter=Q(related_to__published=True)
+                ),
+                parents_count=Count(
+                    'related_to', filter=Q(related_to__published=True), distinct=True
+                ),
+            )
+            .values(
+                'pk',
+                'date_changed',
+                'showroom_id',
+                'media_modified',
+                'media_version',
+                'to_changed',
+                'to_count',
+                'parents_changed',
+                'parents_count',
+            )
+            .first()
+        )
+    return request._entry_version
+
+
+def _entry_etag(version):
+    if version is not None:
+        return make_etag(*version.values())
+
+
+def _entry_last_modified(version):
+    if version is not None:
+        return max(
+            d
+            for d in (
+                version['date_changed'],
+                version['media_modified'],
+                version['to_changed'],
+                version['parents_changed'],
+            )
+            if d is not None
+        )
+
+
+def user_entry_data_etag(request, pk=None, entry=None, *args, **kwargs):
+    return _entry_etag(get_entry_version(request, pk=entry, owner__username=pk))
+
+
+def user_entry_data_last_modified(request, pk=None, entry=None, *args, **kwargs):
+    return _entry_last_modified(
+        get_entry_version(request, pk=entry, owner__username=pk)
+    )
+
+
+def entry_data_etag(request, pk=None, *args, **kwargs):
+    return _entry_etag(get_entry_version(request, pk=pk))
+
+
+def entry_data_last_modified(request, pk=None, *args, **kwargs):
+    return _entry_last_modified(get_entry_version(request, pk=pk))
@@ -8,10 +8,15 @@ from django.urls import reverse_lazy
 from django.utils.text import format_lazy
 from django.utils.translation import gettext_lazy as _
 
-from core.models import Entry, Relation
+from core.models import Entry, EntryContributor, Relation
 from core.skosmos import get_preflabel_lazy
 from core.utils import placeholder_lazy
-from media_server.models import get_image_for_entry, has_entry_media
+from media_server.models import (
+    get_entries_with_media,
+    get_image_for_entry,
+    get_images_for_entries,
+    has_entry_media,
+)
 
 from . import CleanModelSerializer, SwaggerMetaModelSerializer
 
@@ -45,14 +50,82 @@ class RelationsSerializer(serializers.Serializer):
     to = RelatedEntrySerializer(read_only=True)
 
 
+def prefetch_entry_data(entries):
+    """Load relations, cover images and media existence for a list of entries.
+
+    Uses a fixed number of queries, independent of the number of entries. The
+    result is passed to EntrySerializer in the context as ``prefetched``.
+    """
+    entry_ids = [e.pk for e in entries]
+
+    parents = {pk: [] for pk in entry_ids}
+    relations = {pk: [] for pk in entry_ids}
+
+    parent_relations = list(
+        Relation.objects.select_related('from_entry').filter(to_entry__in=entry_ids)
+    )
+    child_relations = list(
+        Relation.objects.select_related('to_entry').filter(from_entry__in=entry_ids)
+    )
+
+    images = get_images_for_entries(
+        {r.from_entry_id for r in parent_relations}
+        | {r.to_entry_id for r in child_relations}
+    )
+
+    for relation in parent_relations:
+        parents[relation.to_entry_id].append(
+            {
+                'id': relation.pk,
+                'date_created': relation.date_created,
+                'parent': {
+                    'id': relation.from_entry.pk,
+                    'title': relation.from_entry.title,
+                    'type': relation.from_entry.type,
+                    'image': images.get(relation.from_entry.pk),
+                },
+            }
+        )
+
+    for relation in child_relations:
+        relations[relation.from_entry_id].append(
+            {
+                'id': relation.pk,
+                'date_created': relation.date_created,
+                'to': {
+                    'id': relation.to_entry.pk,
+                    'title': relation.to_entry.title,
+                    'type': relation.to_entry.type,
+                    'image': images.get(relation.to_entry.pk),
+                },
+            }
+        )
+
+    return {
+        'parents': parents,
+        'relations': relations,
+        'has_media': get_entries_with_media(entry_ids),
+    }
+
+
 class EntryBulkCreateSerializer(serializers.ListSerializer):
     def create(self, validated_data):
         entries_data = [Entry(**data) for data in validated_data]
+        # bulk_create does not send pre_save signals
+        for entry in entries_data:
+            entry.update_display()
+            entry.update_years()
+            entry.update_category()
         entries = Entry.objects.bulk_create(entries_data)
         # send post_save signal for published entries so they are pushed to Showroom
+        # and their contributors are indexed, index the others directly
+        contributors = []
         for entry in entries:
             if entry.published:
                 post_save.send(Entry, instance=entry, created=True)
+            else:
+                contributors += EntryContributor.for_entry(entry)
+        EntryContributor.objects.bulk_create(contributors)
         return entries
 
 
@@ -66,7 +139,13 @@ class EntrySerializer(CleanModelSerializer, SwaggerMetaModelSerializer):
     class Meta:
         model = Entry
         list_serializer_class = EntryBulkCreateSerializer
-        fields = '__all__'
+        exclude = (
+            'display',
+            'search_vector_de',
+            'search_vector_en',
+            'years',
+            'category',
+        )
         swagger_meta_attrs = {
             'id': OrderedDict([('hidden', True)]),
             'date_created': OrderedDict([('hidden', True)]),
@@ -162,8 +241,18 @@ class EntrySerializer(CleanModelSerializer, SwaggerMetaModelSerializer):
             'has_media': OrderedDict([('hidden', True)]),
         }
 
+    def _get_prefetched(self, key, obj):
+        prefetched = self.context.get('prefetched')
+        if prefetched is not None and obj.pk in prefetched['parents']:
+            return prefetched[key]
+        return None
+
     @swagger_serializer_method(serializer_or_field=ParentSerializer)
     def get_parents(self, obj):
+        prefetched = self._get_prefetched('parents', obj)
+        if prefetched is not None:
+            return prefetched[obj.pk]
+
         ret = []
         for relation in Relation.objects.select_related('from_entry').filter(
             to_entry=obj
@@ -184,6 +273,10 @@ class EntrySerializer(CleanModelSerializer, SwaggerMetaModelSerializer):
 
     @swagger_serializer_method(serializer_or_field=RelationsSerializer)
     def get_relations(self, obj):
+        prefetched = self._get_prefetched('relations', obj)
+        if prefetched is not None:
+            return prefetched[obj.pk]
+
         ret = []
         for relation in Relation.objects.select_related('to_entry').filter(
             from_entry=obj
@@ -206,4 +299,7 @@ class EntrySerializer(CleanModelSerializer, SwaggerMetaModelSerializer):
         return obj.icon
 
     def get_has_media(self, obj) -> bool:
+        prefetched = self._get_prefetched('has_media', obj)
+        if prefetched is not None:
+            return obj.pk in prefetched
         return has_entry_media(obj.pk)
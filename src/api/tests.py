@@ -0,0 +1,54 @@
+from rest_framework.test import APIClient
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+from core.models import Entry
+
+
+class EntrySearchPaginationTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('search_user')
+        for title in [
+            'Sculpture',
+            'Sculpture garden',
+            'Sculptures of the city',
+            'Small sculptures and paintings in the museum',
+            'Sculpting',
+            'Unrelated title',
+        ]:
+            Entry.objects.create(title=title, owner=self.user)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse('entry-list', kwargs={'version': 'v1'})
+
+    def test_cursor_pages_keep_search_rank_order(self):
+        query = 'sculpture'
+        ranks = dict(
+            Entry.objects.search(query)
+            .filter(owner=self.user)
+            .values_list('pk', 'rank')
+        )
+        self.assertGreater(len(ranks), 2)
+
+        response = self.client.get(self.url, {'q': query, 'cursor': '', 'limit': 2})
+        self.assertEqual(response.status_code, 200)
+        first_page = [e['id'] for e in response.data['results']]
+        self.assertEqual(len(first_page), 2)
+        self.assertIsNotNone(response.data['next'])
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual(response.status_code, 200)
+        second_page = [e['id'] for e in response.data['results']]
+        self.assertTrue(second_page)
+
+        ids = first_page + second_page
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertEqual(
+            [ranks[pk] for pk in ids],
+            sorted((ranks[pk] for pk in ids), reverse=True),
+        )
+        # the second page continues with the next most relevant entries
+        expected = sorted(ranks, key=lambda pk: (-ranks[pk], pk))[: len(ids)]
+        self.assertEqual([ranks[pk] for pk in ids], [ranks[pk] for pk in expected])
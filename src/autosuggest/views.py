@@ -4,6 +4,7 @@ import logging
 from apimapper import APIMapper
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
+from rest_framework import exceptions
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework.utils.encoders import JSONEncoder
@@ -12,7 +13,7 @@ from django.conf import settings
 from django.utils.module_loading import import_string
 
 from api.yasg import language_header_parameter
-from core.skosmos import autosuggest
+from core.skosmos import autosuggest_source
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,14 @@ fieldname_paramter = openapi.Parameter(
     enum=list(settings.ACTIVE_SOURCES.keys()),
 )
 
+limit_parameter = openapi.Parameter(
+    'limit',
+    openapi.IN_QUERY,
+    required=False,
+    description='Maximum number of results (only applies to vocabularies)',
+    type=openapi.TYPE_INTEGER,
+)
+
 
 @swagger_auto_schema(
     methods=['get'],
@@ -47,7 +56,7 @@ def lookup_view(request, fieldname, *args, **kwargs):
 
 @swagger_auto_schema(
     methods=['get'],
-    manual_parameters=[fieldname_paramter, language_header_parameter],
+    manual_parameters=[fieldname_paramter, language_header_parameter, limit_parameter],
     operation_id='autosuggest_v1_lookup',
 )
 @api_view(['GET'])
@@ -58,7 +67,15 @@ def lookup_view_search(request, fieldname, searchstr='', *args, **kwargs):
         source = source.get('search', ())
 
     if isinstance(source, str):
-        data = autosuggest(import_string(source)(), searchstr)
+        try:
+            limit = int(request.query_params['limit'])
+            if limit < 0:
+                raise ValueError('limit must not be negative')
+        except KeyError:
+            limit = None
+        except ValueError as e:
+            raise exceptions.ParseError() from e
+        data = autosuggest_source(source, searchstr, limit=limit)
     else:
         data = fetch_responses(searchstr, source)
 
@@ -1,5 +1,50 @@
+import django_rq
+
 from django.apps import AppConfig
 
 
 class CoreConfig(AppConfig):
     name = 'core'
+
+    def ready(self):
+        scheduler = django_rq.get_scheduler('default')
+
+        job_id = '5b0d5a3e-2f0e-4c1b-9a57-0c6e3f1d8a42'
+
+        if job_id not in scheduler:
+            scheduler.cron(
+                '35 1 * * *',
+                'core.skosmos.sync_vocabulary_mirror',
+                id=job_id,
+                timeout=3600,
+            )
+
+        job_id = 'c2d8f0b6-7e43-4a1d-8f5b-3b9e6a0d2c71'
+
+        if job_id not in scheduler:
+            scheduler.cron(
+                '50 */6 * * *',
+                'core.skosmos.refresh_vocabularies',
+                id=job_id,
+                timeout=3600,
+            )
+
+        job_id = '8e4f1c27-93ab-4d5e-b6a0-5f2d7c9e1b34'
+
+        if job_id not in scheduler:
+            scheduler.cron(
+                '45 1 * * *',
+                'core.schemas.snapshot.update_snapshot',
+                id=job_id,
+                timeout=3600,
+            )
+
+        job_id = 'f3a9b6d1-4c2e-4e8a-a7d5-92b1c0e6f48d'
+
+        if job_id not in scheduler:
+            scheduler.cron(
+                '15 2 * * *',
+                'core.reporting.rebuild_reports',
+                id=job_id,
+                timeout=3600,
+            )
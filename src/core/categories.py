@@ -0,0 +1,397 @@
+"""Categories of entries in the profile of a user.
+
+Every entry is sorted into exactly one category, depending on its type and on
+the fields and roles in which its owner is named as contributor. The rules are
+declared in ``CATEGORY_RULES`` and evaluated in order, the first matching rule
+determines the category. A rule matches, if the type of the entry is in all
+of its type sets and, if it has conditions, the owner is a contributor in one
+of the condition's fields, with one of the condition's roles (or with any role
+if the roles are ``None``).
+
+The rules are compiled into a mapping from each type to its applicable rules,
+which is rebuilt whenever the vocabularies change. The category is stored on
+the entry when it is saved.
+"""
+from django.utils.translation import get_language
+
+from .skosmos import (
+    get_altlabel_collection,
+    get_collection_members,
+    get_vocabulary_version,
+    label_cache,
+)
+
+TAXONOMY = 'http://base.uni-ak.ac.at/portfolio/taxonomy/'
+VOCABULARY = 'http://base.uni-ak.ac.at/portfolio/vocabulary/'
+
+DEFAULT_CATEGORY = 'general_activities'
+
+
+def collection(name):
+    return ('collection', f'{TAXONOMY}{name}')
+
+
+def types(*names):
+    return ('types', frozenset(f'{TAXONOMY}{n}' for n in names))
+
+
+def roles(*names):
+    return frozenset(f'{VOCABULARY}{n}' for n in names)
+
+
+DOCUMENTS = collection('collection_document_publication')
+CONFERENCES = collection('collection_conference')
+EVENTS = collection('collection_event')
+RESEARCH_PROJECTS = collection('collection_research_project')
+JOURNALISTIC_ACTIVITIES = collection('collection_journalistic_activity')
+
+# (category, type sets, conditions as list of (field, roles))
+CATEGORY_RULES = [
+    # science to public
+    ('public_appearance', [collection('collection_public_appearance')], []),
+    (
+        'public_appearance',
+        [types('discussion', 'panel_discussion', 'roundtable', 'panel')],
+        [('contributors', roles('discussion', 'panelist'))],
+    ),
+    (
+        'public_appearance',
+        [types('recitation')],
+        [
+            (
+                'contributors',
+                roles(
+                    'reading',
+                    'actor',
+                    'performing_artist',
+                    'artist',
+                    'performance',
+                    'presentation',
+                    'speech',
+                    'speaker',
+                    'lecturer',
+                ),
+            ),
+        ],
+    ),
+    (
+        'public_appearance',
+        [types('authors_presentation', 'book_presentation')],
+        [('contributors', roles('author'))],
+    ),
+    (
+        'public_appearance',
+        [JOURNALISTIC_ACTIVITIES],
+        [('contributors', roles('mention', 'talk', 'contribution', 'interviewee'))],
+    ),
+    (
+        'mediation',
+        [collection('collection_mediation')],
+        [('contributors', roles('mediation'))],
+    ),
+    (
+        'visual_and_verbal_presentations',
+        [collection('collection_visual_verbal_presentation')],
+        [],
+    ),
+    (
+        'general_activity_science_to_public',
+        [collection('collection_general_activity_science_to_public')],
+        [],
+    ),
+    # functions & practice
+    (
+        'journalistic_activity',
+        [JOURNALISTIC_ACTIVITIES],
+        [
+            ('authors', None),
+            ('editors', None),
+            (
+                'contributors',
+                roles(
+                    'author',
+                    'editing',
+                    'editor',
+                    'interviewer',
+                    'photography',
+                    'speaker',
+                    'moderation',
+                ),
+            ),
+        ],
+    ),
+    # publications
+    (
+        'monographs',
+        [DOCUMENTS, collection('collection_monograph')],
+        [('authors', None)],
+    ),
+    (
+        'composite_volumes',
+        [DOCUMENTS, collection('collection_composite_volume')],
+        [('editors', None)],
+    ),
+    (
+        'composite_volumes',
+        [DOCUMENTS],
+        [('contributors', roles('series_and_journal_editorship'))],
+    ),
+    ('articles', [DOCUMENTS, collection('collection_article')], [('authors', None)]),
+    ('chapters', [DOCUMENTS, collection('collection_chapter')], [('authors', None)]),
+    ('reviews', [DOCUMENTS, collection('collection_review')], [('authors', None)]),
+    (
+        'supervisions_of_theses',
+        [DOCUMENTS, collection('collection_supervision_of_theses')],
+        [('contributors', roles('expertizing', 'supervisor'))],
+    ),
+    ('general_documents_publications', [DOCUMENTS], []),
+    # conferences
+    (
+        'teaching',
+        [CONFERENCES, collection('collection_teaching')],
+        [('lecturers', None)],
+    ),
+    (
+        'teaching',
+        [CONFERENCES, collection('collection_education_qualification')],
+        [('lecturers', None)],
+    ),
+    (
+        'education_qualifications',
+        [CONFERENCES, collection('collection_education_qualification')],
+        [('contributors', roles('attendance'))],
+    ),
+    ('conferences_symposia', [CONFERENCES], []),
+    # events
+    (
+        'memberships',
+        [EVENTS],
+        [
+            (
+                'contributors',
+                roles(
+                    'member',
+                    'board_member',
+                    'advisory_board',
+                    'commissions_boards',
+                    'appointment_committee',
+                    'jury',
+                    'chair',
+                    'board_of_directors',
+                ),
+            ),
+        ],
+    ),
+    (
+        'expert_functions',
+        [EVENTS],
+        [('contributors', roles('expertizing', 'committee_work'))],
+    ),
+    ('general_functions_practice', [EVENTS], []),
+    # research projects
+    (
+        'teaching',
+        [
+            RESEARCH_PROJECTS,
+            types('teaching_project_teaching_research_project'),
+        ],
+        [('project_lead', None)],
+    ),
+    ('research_projects', [RESEARCH_PROJECTS], []),
+    # other collections
+    ('awards_and_grants', [collection('collection_awards_and_grants')], []),
+    (
+        'fellowships_visiting_affiliations',
+        [collection('collection_fellowship_visiting_affiliation')],
+        [],
+    ),
+    ('exhibitions', [collection('collection_exhibition')], []),
+    (
+        'conference_contributions',
+        [collection('collection_conference_contribution')],
+        [],
+    ),
+    ('architectures', [collection('collection_architecture')], []),
+    ('audios', [collection('collection_audio')], []),
+    ('concerts', [collection('collection_concert')], []),
+    ('design', [collection('collection_design')], []),
+    ('festivals', [collection('collection_festival')], []),
+    ('images', [collection('collection_image')], []),
+    ('performances', [collection('collection_performance')], []),
+    ('sculptures', [collection('collection_sculpture')], []),
+    ('software', [collection('collection_software')], []),
+    ('videos', [collection('collection_film_video')], []),
+]
+
+# labels of the categories, as collections of the taxonomy
+CATEGORY_LABELS = {
+    'publications': 'collection_document_publication',
+    'monographs': 'collection_monograph',
+    'composite_volumes': 'collection_composite_volume',
+    'articles': 'collection_article',
+    'chapters': 'collection_chapter',
+    'reviews': 'collection_review',
+    'general_documents_publications': 'collection_general_document_publication',
+    'research_projects': 'collection_research_project',
+    'awards_and_grants': 'collection_awards_and_grants',
+    'fellowships_visiting_affiliations': 'collection_fellowship_visiting_affiliation',
+    'exhibitions': 'collection_exhibition',
+    'supervisions_of_theses': 'collection_supervision_of_theses',
+    'teaching': 'collection_teaching',
+    'conferences_symposia': 'collection_conference_symposium',
+    'conference_contributions': 'collection_conference_contribution',
+    'architectures': 'collection_architecture',
+    'audios': 'collection_audio',
+    'concerts': 'collection_concert',
+    'design': 'collection_design',
+    'education_qualifications': 'collection_education_qualification',
+    'functions_practice': 'collection_functions_practice',
+    'memberships': 'collection_membership ',
+    'expert_functions': 'collection_expert_function ',
+    'journalistic_activity': 'collection_journalistic_activity ',
+    'general_functions_practice': 'general_function_and_practice',
+    'festivals': 'collection_festival',
+    'images': 'collection_image',
+    'performances': 'collection_performance',
+    'science_to_public': 'collection_science_to_public',
+    'public_appearance': 'collection_public_appearance',
+    'mediation': 'collection_mediation',
+    'visual_and_verbal_presentations': 'collection_visual_verbal_presentation',
+    'general_activity_science_to_public': (
+        'collection_general_activity_science_to_public'
+    ),
+    'sculptures': 'collection_sculpture',
+    'software': 'collection_software',
+    'videos': 'collection_film_video',
+    'general_activities': 'collection_general_activity ',
+}
+
+# order of the categories in the profile, as (category, subcategories)
+PROFILE_CATEGORIES = [
+    (
+        'publications',
+        [
+            'monographs',
+            'composite_volumes',
+            'articles',
+            'chapters',
+            'reviews',
+            'general_documents_publications',
+        ],
+    ),
+    ('research_projects', None),
+    ('awards_and_grants', None),
+    ('fellowships_visiting_affiliations', None),
+    ('exhibitions', None),
+    ('teaching', ['supervisions_of_theses', 'teaching']),
+    ('conferences_symposia', None),
+    ('conference_contributions', None),
+    ('architectures', None),
+    ('audios', None),
+    ('concerts', None),
+    ('design', None),
+    ('education_qualifications', None),
+    (
+        'functions_practice',
+        [
+            'memberships',
+            'expert_functions',
+            'journalistic_activity',
+            'general_functions_practice',
+        ],
+    ),
+    ('festivals', None),
+    ('images', None),
+    ('performances', None),
+    (
+        'science_to_public',
+        [
+            'public_appearance',
+            'mediation',
+            'visual_and_verbal_presentations',
+            'general_activity_science_to_public',
+        ],
+    ),
+    ('sculptures', None),
+    ('software', None),
+    ('videos', None),
+    ('general_activities', None),
+]
+
+# all categories which entries can be sorted into
+CATEGORIES = [
+    c
+    for category, subcategories in PROFILE_CATEGORIES
+    for c in subcategories or [category]
+]
+
+_compiled = None
+_compiled_version = None
+
+
+def _resolve(type_set):
+    kind, value = type_set
+    if kind == 'collection':
+        return frozenset(get_collection_members(value))
+    return value
+
+
+def compile_rules():
+    """Compile the rules into a mapping from types to their applicable rules.
+
+    The rules of a type are kept in order and end with the first rule without
+    conditions, since later rules can never match.
+    """
+    dispatch = {}
+    for category, type_sets, conditions in CATEGORY_RULES:
+        matching_types = frozenset.intersection(*(_resolve(t) for t in type_sets))
+        for t in matching_types:
+            rules = dispatch.setdefault(t, [])
+            if rules and not rules[-1][1]:
+                continue
+            rules.append((category, conditions))
+    return dispatch
+
+
+def get_rules():
+    global _compiled
+    global _compiled_version
+
+    version = (get_vocabulary_version(), label_cache.version)
+    if _compiled is None or version != _compiled_version:
+        _compiled = compile_rules()
+        _compiled_version = version
+    return _compiled
+
+
+def _contributor_roles(data, field, source):
+    """Return the roles of a contributor in a field, or None if not included."""
+    ret = None
+    for c in data.get(field) or []:
+        if isinstance(c, dict) and c.get('source') == source:
+            ret = ret or set()
+            ret.update(
+                r.get('source') for r in c.get('roles') or [] if isinstance(r, dict)
+            )
+    return ret
+
+
+def get_category(entry_type, data, source):
+    """Return the category of an entry of a type for one of its contributors."""
+    data = data or {}
+    for category, conditions in get_rules().get(entry_type, []):
+        if not conditions:
+            return category
+        for field, field_roles in conditions:
+            contributor_roles = _contributor_roles(data, field, source)
+            if contributor_roles is not None and (
+                field_roles is None or field_roles & contributor_roles
+            ):
+                return category
+    return DEFAULT_CATEGORY
+
+
+def get_category_label(category, lang=None):
+    return get_altlabel_collection(
+        CATEGORY_LABELS[category], lang=lang or get_language() or 'en'
+    )
@@ -1,16 +1,12 @@
 import csv
-import operator
-from functools import reduce
 
 from progressbar import progressbar
 
 from django.conf import settings
 from django.core.management.base import BaseCommand
-from django.db.models import Q
 from django.utils import translation
 
 from core.models import Entry
-from core.schemas import get_active_schemas
 from core.skosmos import get_preflabel_lazy
 
 
@@ -75,21 +71,10 @@ class Command(BaseCommand):
                     'data' if lang == 'en' else 'Daten',
                 ]
             )
-            date_filters = []
-            date_fields = []
-            schemas = get_active_schemas()
-
-            for s in schemas:
-                date_fields += s().date_fields
-
             query = Entry.objects.filter(published=True)
 
             if year != 'all':
-                for df in list(set(date_fields)):
-                    date_filters.append({f'data__{df}__icontains': year})
-                query = query.filter(
-                    reduce(operator.or_, (Q(**x) for x in date_filters))
-                )
+                query = query.filter(years__contains=[year])
 
             for e in progressbar(query):
                 data = []
@@ -4,13 +4,31 @@ from titlecase import titlecase
 from django.core.management.base import BaseCommand
 
 from core.models import Entry
-from core.skosmos import get_preflabel
+from core.skosmos import get_preflabels
 
 
 class Command(BaseCommand):
     help = 'Fix missing labels or empty objects in keywords'
 
     def handle(self, *args, **options):
+        # resolve the labels of all keywords without label at once per project
+        sources = {'basekw': set(), 'disciplines': set()}
+        for keywords in Entry.objects.exclude(keywords__isnull=True).values_list(
+            'keywords', flat=True
+        ):
+            for kw in keywords or []:
+                if not kw.get('label') and kw.get('source'):
+                    if 'disciplines' in kw['source']:
+                        sources['disciplines'].add(kw['source'])
+                    else:
+                        sources['basekw'].add(kw['source'])
+        labels = {}
+        for project, project_sources in sources.items():
+            if project_sources:
+                labels.update(
+                    get_preflabels(project_sources, ['de', 'en'], project=project)
+                )
+
         for e in progressbar(Entry.objects.all()):
             if e.keywords:
                 need_to_save = False
@@ -19,26 +37,9 @@ class Command(BaseCommand):
                     if not kw.get('label'):
                         need_to_save = True
                         if kw.get('source'):
-                            graph, concept = kw['source'].rsplit('/', 1)
-                            if 'disciplines' in kw['source']:
-                                project = 'disciplines'
-                            else:
-                                project = 'basekw'
                             e.keywords[idx]['label'] = {
-                                'de': get_preflabel(
-                                    concept,
-                                    project=project,
-                                    graph=f'{graph}/',
-                                    lang='de',
-                                ),
-                                'en': titlecase(
-                                    get_preflabel(
-                                        concept,
-                                        project=project,
-                                        graph=f'{graph}/',
-                                        lang='en',
-                                    )
-                                ),
+                                'de': labels[kw['source']]['de'],
+                                'en': titlecase(labels[kw['source']]['en']),
                             }
                         else:
                             need_to_filter = True
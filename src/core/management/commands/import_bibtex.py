@@ -12,59 +12,79 @@ from django.core.management.base import BaseCommand, CommandError
 from core.models import Entry
 from core.schemas import TypeModelSchema
 from core.schemas.entries.document import DocumentSchema
-from core.skosmos import get_preflabel
-
+from core.skosmos import get_preflabels
+
+TAXONOMY = 'http://base.uni-ak.ac.at/portfolio/taxonomy/'
+VOCABULARY = 'http://base.uni-ak.ac.at/portfolio/vocabulary/'
+LANGUAGES = 'http://base.uni-ak.ac.at/portfolio/languages/'
+
+# bibtex types as keys, type concepts as values
+TYPE_MAPPING = {
+    'article': f'{TAXONOMY}article',
+    'book': f'{TAXONOMY}scientific_publication',
+    'booklet': f'{TAXONOMY}catalogue',
+    'conference': f'{TAXONOMY}catalogue',
+    'inproceedings': f'{TAXONOMY}conference_proceedings',
+    'inbook': f'{TAXONOMY}chapter',
+    'incollection': f'{TAXONOMY}series_monographic_series',
+    'manual': f'{TAXONOMY}scientific_publication',
+    'masterthesis': f'{TAXONOMY}master_thesis',
+    'phdthesis': f'{TAXONOMY}doctoral_dissertation',
+    'proceedings': f'{TAXONOMY}conference_proceedings',
+}
+
+# all concepts used by the importer, their labels are fetched at once before
+# the import, see load_labels()
+CONCEPTS = {
+    *TYPE_MAPPING.values(),
+    *(
+        f'{VOCABULARY}{name}'
+        for name in [
+            'abstract',
+            'author',
+            'description',
+            'editor',
+            'organisation',
+            'partner_institution',
+            'publisher',
+        ]
+    ),
+    f'{LANGUAGES}de',
+    f'{LANGUAGES}en',
+}
 
-def get_label(uri, lang):
-    return get_preflabel(uri.split('/')[-1], lang=lang)
+_labels = {}
 
 
-def get_type_label(uri, lang):
-    return get_preflabel(
-        uri.split('/')[-1],
-        project=settings.TAX_ID,
-        graph=settings.TAX_GRAPH,
-        lang=lang,
-    )
+def load_labels():
+    langs = {'de', 'en', *(lang for lang, _lstring in settings.LANGUAGES)}
+    _labels.update(get_preflabels(CONCEPTS, sorted(langs)))
 
 
-def get_language_label(lang, label_lang):
-    graph = 'http://base.uni-ak.ac.at/portfolio/languages/'
-    return get_preflabel(
-        lang,
-        project=settings.LANGUAGES_VOCID,
-        graph=graph,
-        lang=label_lang,
-    )
+def get_labels(uri, langs=('de', 'en')):
+    if uri not in _labels:
+        _labels.update(get_preflabels([uri], langs))
+    return {lang: _labels[uri][lang] for lang in langs}
 
 
 def get_role_object(uri):
     return {
         'source': uri,
-        'label': {
-            'de': get_label(uri, 'de'),
-            'en': get_label(uri, 'en'),
-        },
+        'label': get_labels(uri),
     }
 
 
 def get_type_object(uri):
     return {
         'source': uri,
-        'label': {
-            'de': get_type_label(uri, 'de'),
-            'en': get_type_label(uri, 'en'),
-        },
+        'label': get_labels(uri),
     }
 
 
 def get_text_type_object(uri):
     return {
         'source': uri,
-        'label': {
-            'de': get_label(uri, 'de'),
-            'en': get_label(uri, 'en'),
-        },
+        'label': get_labels(uri),
     }
 
 
@@ -81,12 +101,13 @@ def get_text_object(text):
 
 
 def get_language_object(lang):
+    uri = f'{LANGUAGES}{lang}'
     return {
-        'source': f'http://base.uni-ak.ac.at/portfolio/languages/{lang}',
-        'label': {
-            label_lang: get_language_label(lang, label_lang)
-            for label_lang, _lstring in settings.LANGUAGES
-        },
+        'source': uri,
+        'label': get_labels(
+            uri,
+            langs=[label_lang for label_lang, _lstring in settings.LANGUAGES],
+        ),
     }
 
 
@@ -174,44 +195,11 @@ class Command(BaseCommand):
                 f'Error when loading BibTeX database: {repr(err)}'
             ) from err
 
-        # type mapping
+        load_labels()
+
         # bibtex type as keys
         # type object as values
-        type_mapping = {
-            'article': get_type_object(
-                'http://base.uni-ak.ac.at/portfolio/taxonomy/article'
-            ),
-            'book': get_type_object(
-                'http://base.uni-ak.ac.at/portfolio/taxonomy/scientific_publication'
-            ),
-            'booklet': get_type_object(
-                'http://base.uni-ak.ac.at/portfolio/taxonomy/catalogue'
-            ),
-            'conference': get_type_object(
-                'http://base.uni-ak.ac.at/portfolio/taxonomy/catalogue'
-            ),
-            'inproceedings': get_type_object(
-                'http://base.uni-ak.ac.at/portfolio/taxonomy/conference_proceedings'
-            ),
-            'inbook': get_type_object(
-                'http://base.uni-ak.ac.at/portfolio/taxonomy/chapter'
-            ),
-            'incollection': get_type_object(
-                'http://base.uni-ak.ac.at/portfolio/taxonomy/series_monographic_series'
-            ),
-            'manual': get_type_object(
-                'http://base.uni-ak.ac.at/portfolio/taxonomy/scientific_publication'
-            ),
-            'masterthesis': get_type_object(
-                'http://base.uni-ak.ac.at/portfolio/taxonomy/master_thesis'
-            ),
-            'phdthesis': get_type_object(
-                'http://base.uni-ak.ac.at/portfolio/taxonomy/doctoral_dissertation'
-            ),
-            'proceedings': get_type_object(
-                'http://base.uni-ak.ac.at/portfolio/taxonomy/conference_proceedings'
-            ),
-        }
+        type_mapping = {k: get_type_object(v) for k, v in TYPE_MAPPING.items()}
 
         # ensure type objects are still valid
         for _k, v in type_mapping.items():
@@ -8,7 +8,7 @@ from titlecase import titlecase
 from django.core.management.base import BaseCommand
 
 from core.models import Entry
-from core.skosmos import get_preflabel
+from core.skosmos import get_preflabels
 
 
 class Command(BaseCommand):
@@ -26,6 +26,10 @@ class Command(BaseCommand):
 
         counter = Counter(keywords_list)
 
+        labels = get_preflabels(
+            [kw for kw in counter if kw.startswith('http')], ['de', 'en']
+        )
+
         today = date.today().strftime('%d-%m-%Y')
 
         with open(f'export/{today}_keywords_usage.csv', mode='w') as csvfile:
@@ -45,25 +49,8 @@ class Command(BaseCommand):
             )
             for kw, num in progressbar(counter.most_common()):
                 if kw.startswith('http'):
-                    graph, concept = kw.rsplit('/', 1)
-                    if 'disciplines' in kw:
-                        project = 'disciplines'
-                    else:
-                        project = 'basekw'
-                    label_en = titlecase(
-                        get_preflabel(
-                            concept,
-                            project=project,
-                            graph=f'{graph}/',
-                            lang='en',
-                        )
-                    )
-                    label_de = get_preflabel(
-                        concept,
-                        project=project,
-                        graph=f'{graph}/',
-                        lang='de',
-                    )
+                    label_en = titlecase(labels[kw]['en'])
+                    label_de = labels[kw]['de']
 
                     csv_writer.writerow(
                         [
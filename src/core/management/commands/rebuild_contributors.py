@@ -0,0 +1,42 @@
+from progressbar import progressbar
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.models import Entry, EntryContributor, invalidate_user_data
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the contributor index of all entries'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of contributors which are inserted at once (default: 500)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        batch = []
+
+        entries = Entry.objects.only('id', 'data')
+
+        with transaction.atomic():
+            EntryContributor.objects.all().delete()
+
+            for e in progressbar(
+                entries.iterator(chunk_size=batch_size), max_value=entries.count()
+            ):
+                batch += EntryContributor.for_entry(e)
+                if len(batch) >= batch_size:
+                    EntryContributor.objects.bulk_create(batch)
+                    batch = []
+
+            if batch:
+                EntryContributor.objects.bulk_create(batch)
+
+        invalidate_user_data()
+
+        self.stdout.write(self.style.SUCCESS('Successfully rebuilt contributor index'))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from core.reporting import rebuild_reports
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the report rows of all published entries'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of report rows which are inserted at once (default: 500)',
+        )
+
+    def handle(self, *args, **options):
+        count = rebuild_reports(batch_size=options['batch_size'])
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully rebuilt {count} report rows')
+        )
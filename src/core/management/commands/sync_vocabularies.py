@@ -0,0 +1,26 @@
+from requests import RequestException
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.skosmos import sync_vocabulary_mirror
+
+
+class Command(BaseCommand):
+    help = 'Sync all concepts of the used vocabularies into the local vocabulary mirror'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source',
+            type=str,
+            help='JSON file in mirror format to use instead of SKOSMOS',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            count = sync_vocabulary_mirror(source=options['source'])
+        except (OSError, RequestException, ValueError) as e:
+            raise CommandError(f'Could not sync vocabulary mirror: {e}') from e
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully synced {count} concepts into mirror')
+        )
@@ -0,0 +1,41 @@
+from progressbar import progressbar
+
+from django.core.management.base import BaseCommand
+
+from core.models import Entry, invalidate_user_data
+
+
+class Command(BaseCommand):
+    help = 'Compute the profile categories of all entries'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of entries which are updated at once (default: 500)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        batch = []
+
+        entries = Entry.objects.select_related('owner').only(
+            'id', 'type', 'data', 'category', 'owner__username'
+        )
+
+        for e in progressbar(
+            entries.iterator(chunk_size=batch_size), max_value=entries.count()
+        ):
+            e.update_category()
+            batch.append(e)
+            if len(batch) >= batch_size:
+                Entry.objects.bulk_update(batch, ['category'])
+                batch = []
+
+        if batch:
+            Entry.objects.bulk_update(batch, ['category'])
+
+        invalidate_user_data()
+
+        self.stdout.write(self.style.SUCCESS('Successfully updated categories'))
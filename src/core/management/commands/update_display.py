@@ -0,0 +1,39 @@
+from progressbar import progressbar
+
+from django.core.management.base import BaseCommand
+
+from core.models import Entry, invalidate_user_data
+
+
+class Command(BaseCommand):
+    help = 'Compute the precomputed display values of all entries'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of entries which are updated at once (default: 500)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        batch = []
+
+        entries = Entry.objects.select_related('owner')
+
+        for e in progressbar(
+            entries.iterator(chunk_size=batch_size), max_value=entries.count()
+        ):
+            e.update_display()
+            batch.append(e)
+            if len(batch) >= batch_size:
+                Entry.objects.bulk_update(batch, ['display'])
+                batch = []
+
+        if batch:
+            Entry.objects.bulk_update(batch, ['display'])
+
+        invalidate_user_data()
+
+        self.stdout.write(self.style.SUCCESS('Successfully updated display values'))
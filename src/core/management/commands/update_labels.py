@@ -5,8 +5,8 @@ from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.db.models import JSONField
 
-from core.models import Entry
-from core.skosmos import get_preflabel_via_uri
+from core.models import Entry, invalidate_user_data
+from core.skosmos import get_preflabel_via_uri, label_cache
 
 
 class Command(BaseCommand):
@@ -42,6 +42,9 @@ class Command(BaseCommand):
                     self._walk(v)
 
     def handle(self, *args, **options):
+        # make sure labels are not served from outdated caches
+        label_cache.bump_version()
+
         # gather all fields containing concepts
         fields_to_update = []
         model_fields = Entry._meta.fields
@@ -49,9 +52,17 @@ class Command(BaseCommand):
             if isinstance(field, JSONField):
                 fields_to_update.append(field.name)
 
-        for e in progressbar(Entry.objects.all()):
+        for e in progressbar(Entry.objects.select_related('owner')):
             for field in fields_to_update:
                 self._walk(getattr(e, field))
             if self._need_to_save:
                 e.save()
                 self._need_to_save = False
+            else:
+                # labels in the display values might have changed nonetheless
+                display = e.display
+                e.update_display()
+                if e.display != display:
+                    Entry.objects.filter(pk=e.pk).update(display=e.display)
+
+        invalidate_user_data()
@@ -0,0 +1,19 @@
+from requests import RequestException
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.schemas.snapshot import update_snapshot
+
+
+class Command(BaseCommand):
+    help = 'Update the snapshot of entry types and their labels used by the schemas'
+
+    def handle(self, *args, **options):
+        try:
+            count = update_snapshot()
+        except (OSError, RequestException, ValueError) as e:
+            raise CommandError(f'Could not update schema snapshot: {e}') from e
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully wrote schema snapshot with {count} types')
+        )
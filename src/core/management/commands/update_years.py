@@ -0,0 +1,37 @@
+from progressbar import progressbar
+
+from django.core.management.base import BaseCommand
+
+from core.models import Entry
+
+
+class Command(BaseCommand):
+    help = 'Extract the years covered by the date fields of all entries'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of entries which are updated at once (default: 500)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        batch = []
+
+        entries = Entry.objects.only('id', 'type', 'data', 'years')
+
+        for e in progressbar(
+            entries.iterator(chunk_size=batch_size), max_value=entries.count()
+        ):
+            e.update_years()
+            batch.append(e)
+            if len(batch) >= batch_size:
+                Entry.objects.bulk_update(batch, ['years'])
+                batch = []
+
+        if batch:
+            Entry.objects.bulk_update(batch, ['years'])
+
+        self.stdout.write(self.style.SUCCESS('Successfully updated years'))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.skosmos import refresh_vocabularies
+
+
+class Command(BaseCommand):
+    help = 'Fetch all vocabularies in all languages and store them in the cache'
+
+    def handle(self, *args, **options):
+        count = refresh_vocabularies()
+
+        if count is None:
+            raise CommandError('A vocabulary refresh is already running')
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully warmed {count} vocabularies')
+        )
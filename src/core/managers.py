@@ -1,16 +1,15 @@
-from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.contrib.postgres.search import SearchQuery, SearchRank
 from django.db import models
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
 
-from general.postgres import SearchVectorJSON, TrigramWordSimilarity
+from general.postgres import TrigramWordSimilarity
 
-search_vectors = (
-    SearchVector('title', weight='A')
-    + SearchVector('subtitle', weight='B')
-    + SearchVectorJSON('texts', weight='B')
-    + SearchVectorJSON('data', weight='B')
-    + SearchVectorJSON('keywords', weight='B')
-    + SearchVector('notes', weight='C')
-)
+# minimum rank of search results. The title prefilter (%>) uses the
+# pg_trgm.word_similarity_threshold, which is set to the same value for every
+# database connection (see core.models.set_word_similarity_threshold), since
+# its default of 0.6 would drop most typo-tolerant title matches
+SEARCH_RANK_THRESHOLD = 0.2
 
 
 class EntryManager(models.Manager):
@@ -21,13 +20,24 @@ class EntryManager(models.Manager):
         return entry
 
     def search(self, text):
-        search_query = SearchQuery(text)
-        search_rank = SearchRank(search_vectors, search_query)
+        # search vectors are stored per language and kept up to date by a
+        # database trigger, so that the filter can use the GIN indexes
+        search_query_de = SearchQuery(text, config='german')
+        search_query_en = SearchQuery(text, config='english')
+        search_rank = Greatest(
+            SearchRank(F('search_vector_de'), search_query_de),
+            SearchRank(F('search_vector_en'), search_query_en),
+        )
         trigram_word_similarity_title = TrigramWordSimilarity(text, 'title')
         rank = search_rank + trigram_word_similarity_title
         return (
             self.get_queryset()
+            .filter(
+                Q(search_vector_de=search_query_de)
+                | Q(search_vector_en=search_query_en)
+                | Q(title__trigram_word_similar=text)
+            )
             .annotate(rank=rank)
-            .filter(rank__gte=0.2)
+            .filter(rank__gte=SEARCH_RANK_THRESHOLD)
             .order_by('-rank')
         )
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.20 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_auto_20230822_1854'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='entry',
+            name='display',
+            field=models.JSONField(default=dict, editable=False),
+        ),
+    ]
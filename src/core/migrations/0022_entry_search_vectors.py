@@ -0,0 +1,69 @@
+# Generated by Django 3.2.20 on 2026-10-18 11:02
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('{config}', coalesce(NEW.title, '')), 'A')
+    || setweight(to_tsvector('{config}', coalesce(NEW.subtitle, '')), 'B')
+    || setweight(to_tsvector('{config}', coalesce(NEW.texts, '""'::jsonb)), 'B')
+    || setweight(to_tsvector('{config}', coalesce(NEW.data, '""'::jsonb)), 'B')
+    || setweight(to_tsvector('{config}', coalesce(NEW.keywords, '""'::jsonb)), 'B')
+    || setweight(to_tsvector('{config}', coalesce(NEW.notes, '')), 'C')
+"""
+
+CREATE_TRIGGER_SQL = f"""
+CREATE FUNCTION core_entry_search_vectors_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector_de := {SEARCH_VECTOR_SQL.format(config='german')};
+    NEW.search_vector_en := {SEARCH_VECTOR_SQL.format(config='english')};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER core_entry_search_vectors_update
+    BEFORE INSERT OR UPDATE OF title, subtitle, texts, data, keywords, notes
+    ON core_entry
+    FOR EACH ROW EXECUTE PROCEDURE core_entry_search_vectors_update();
+
+UPDATE core_entry SET title = title;
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS core_entry_search_vectors_update ON core_entry;
+DROP FUNCTION IF EXISTS core_entry_search_vectors_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_entry_display'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='entry',
+            name='search_vector_de',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='entry',
+            name='search_vector_en',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER_SQL, DROP_TRIGGER_SQL),
+        migrations.AddIndex(
+            model_name='entry',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector_de'], name='core_entry_search__2994cf_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector_en'], name='core_entry_search__ecd1f2_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='core_entry_title_trgm_gin', opclasses=['gin_trgm_ops']),
+        ),
+    ]
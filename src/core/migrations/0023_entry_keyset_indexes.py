@@ -0,0 +1,44 @@
+# Generated by Django 3.2.20 on 2026-10-18 11:40
+
+import django.db.models.fields.json
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_entry_search_vectors'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(models.F('owner'), django.db.models.functions.text.Lower('title'), models.F('id'), name='entry_keyset_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(models.F('owner'), models.F('date_created'), models.F('id'), name='entry_keyset_date_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(models.F('owner'), models.F('date_changed'), models.F('id'), name='entry_keyset_date_changed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(models.F('owner'), models.F('published'), models.F('id'), name='entry_keyset_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(models.F('owner'), django.db.models.functions.comparison.Coalesce(django.db.models.functions.text.Lower(django.db.models.fields.json.KeyTextTransform('source', 'type')), models.Value('')), models.F('id'), name='entry_keyset_type_source_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(models.F('owner'), django.db.models.functions.comparison.Coalesce(django.db.models.functions.text.Lower(django.db.models.fields.json.KeyTextTransform('de', django.db.models.fields.json.KeyTextTransform('label', 'type'))), models.Value('')), models.F('id'), name='entry_keyset_type_de_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(models.F('owner'), django.db.models.functions.comparison.Coalesce(django.db.models.functions.text.Lower(django.db.models.fields.json.KeyTextTransform('en', django.db.models.fields.json.KeyTextTransform('label', 'type'))), models.Value('')), models.F('id'), name='entry_keyset_type_en_idx'),
+        ),
+    ]
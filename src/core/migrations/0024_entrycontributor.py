@@ -0,0 +1,32 @@
+# Generated by Django 3.2.20 on 2026-10-18 13:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0023_entry_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EntryContributor',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=255)),
+                ('field', models.CharField(max_length=255)),
+                ('role', models.CharField(blank=True, max_length=255, null=True)),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='contributor_index', to='core.entry')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='entrycontributor',
+            index=models.Index(fields=['source', 'field'], name='core_contrib_source_field_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entrycontributor',
+            index=models.Index(fields=['source', 'role'], name='core_contrib_source_role_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.2.20 on 2026-10-18 13:40
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0024_entrycontributor'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='entry',
+            name='years',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.IntegerField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['years'], name='core_entry_years_69788b_gin'),
+        ),
+    ]
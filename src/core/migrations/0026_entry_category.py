@@ -0,0 +1,22 @@
+# Generated by Django 3.2.20 on 2026-10-18 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0025_entry_years'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='entry',
+            name='category',
+            field=models.CharField(blank=True, editable=False, max_length=255, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['owner', 'category'], name='core_entry_owner_category_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 3.2.20 on 2026-10-18 15:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0026_entry_category'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EntryReport',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('type', models.CharField(max_length=255)),
+                ('source', models.CharField(max_length=255)),
+                ('field', models.CharField(max_length=255)),
+                ('role', models.CharField(blank=True, max_length=255, null=True)),
+                ('year', models.IntegerField()),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reports', to='core.entry')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='entryreport',
+            index=models.Index(fields=['year', 'source', 'field'], name='core_report_year_source_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entryreport',
+            index=models.Index(fields=['year', 'type'], name='core_report_year_type_idx'),
+        ),
+    ]
@@ -1,26 +1,72 @@
-from jsonschema import (
-    Draft4Validator,
-    FormatChecker,
-    ValidationError as SchemaValidationError,
-    validate,
-)
+import json
+
+from jsonschema import ValidationError as SchemaValidationError
+from rest_framework.utils.encoders import JSONEncoder
 
 from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
-from django.db import models
-from django.db.models import JSONField
-from django.db.models.signals import pre_save
+from django.db import models, transaction
+from django.db.backends.signals import connection_created
+from django.db.models import F, JSONField, Value
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Coalesce, Lower
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
+from django.utils import translation
 from django.utils.translation import get_language, gettext_lazy as _
 
+from general.cache import GenerationCache
 from general.models import AbstractBaseModel, ShortUUIDField
 
-from .managers import EntryManager
-from .schemas import ICON_DEFAULT, get_icon, get_jsonschema, get_schema
+from .categories import DEFAULT_CATEGORY, get_category
+from .managers import SEARCH_RANK_THRESHOLD, EntryManager
+from .schemas import (
+    CONTRIBUTORS_FIELDS,
+    ICON_DEFAULT,
+    get_entry_validator,
+    get_icon,
+    get_schema_instance,
+    run_validator,
+)
+from .schemas.utils import years_list_from_date_field
 from .skosmos import get_altlabel_lazy, get_preflabel_lazy
 from .validators import validate_keywords, validate_texts, validate_type
 
+# expressions the entry list can be sorted by, which are used for keyset
+# pagination and have a matching index together with owner and id
+SORT_EXPRESSIONS = {
+    'title': Lower('title'),
+    'date_created': F('date_created'),
+    'date_changed': F('date_changed'),
+    'published': F('published'),
+    'type_source': Coalesce(Lower(KeyTextTransform('source', 'type')), Value('')),
+    'type_de': Coalesce(
+        Lower(KeyTextTransform('de', KeyTextTransform('label', 'type'))), Value('')
+    ),
+    'type_en': Coalesce(
+        Lower(KeyTextTransform('en', KeyTextTransform('label', 'type'))), Value('')
+    ),
+}
+
+# fields derived from other fields of an entry, with the fields they depend on
+DERIVED_FIELDS = {
+    'display': {
+        'title',
+        'subtitle',
+        'type',
+        'keywords',
+        'texts',
+        'data',
+        'owner',
+        'owner_id',
+    },
+    'years': {'type', 'data'},
+    'category': {'type', 'data', 'owner', 'owner_id'},
+}
+
 
 class Entry(AbstractBaseModel):
     id = ShortUUIDField(primary_key=True)
@@ -66,6 +112,15 @@ class Entry(AbstractBaseModel):
 
     reference = models.CharField(max_length=255, blank=True, null=True, default=None)
     showroom_id = models.CharField(max_length=255, blank=True, null=True, default=None)
+    # precomputed display values per language, see update_display()
+    display = JSONField(default=dict, editable=False)
+    # maintained by a database trigger, see migration 0022_entry_search_vectors
+    search_vector_de = SearchVectorField(editable=False, null=True)
+    search_vector_en = SearchVectorField(editable=False, null=True)
+    # years covered by the date fields, see update_years()
+    years = ArrayField(models.IntegerField(), default=list, editable=False)
+    # category in the profile of the owner, see update_category()
+    category = models.CharField(max_length=255, blank=True, null=True, editable=False)
 
     objects = EntryManager()
 
@@ -73,40 +128,124 @@ class Entry(AbstractBaseModel):
         indexes = [
             GinIndex(fields=['type']),
             GinIndex(fields=['data']),
+            GinIndex(fields=['search_vector_de']),
+            GinIndex(fields=['search_vector_en']),
+            GinIndex(fields=['years']),
+            models.Index(
+                fields=['owner', 'category'], name='core_entry_owner_category_idx'
+            ),
+            GinIndex(
+                name='core_entry_title_trgm_gin',
+                fields=['title'],
+                opclasses=['gin_trgm_ops'],
+            ),
+            *[
+                models.Index(
+                    F('owner'),
+                    expression,
+                    F('id'),
+                    name=f'entry_keyset_{field}_idx',
+                )
+                for field, expression in SORT_EXPRESSIONS.items()
+            ],
         ]
 
+    def save(self, *args, update_fields=None, **kwargs):
+        if update_fields is not None:
+            # also update the fields derived from the updated fields, which
+            # are computed in the pre_save signal
+            update_fields = set(update_fields)
+            update_fields.update(
+                field
+                for field, sources in DERIVED_FIELDS.items()
+                if sources & update_fields
+            )
+        super().save(*args, update_fields=update_fields, **kwargs)
+
     @property
     def icon(self):
         if self.type:
             return get_icon(self.type.get('source'))
         return ICON_DEFAULT
 
+    def _get_display(self, key):
+        display = (self.display or {}).get(get_language() or 'en')
+        if display is not None and key in display:
+            return display[key]
+        return getattr(self, f'_{key}_display')()
+
+    def update_display(self):
+        # the id is part of the data display, but is usually only assigned when
+        # the entry is saved, after the pre_save signal
+        if not self.pk:
+            self._meta.pk.pre_save(self, True)
+        display = {}
+        for lang, _name in settings.LANGUAGES:
+            with translation.override(lang):
+                values = {
+                    'location': self._location_display(),
+                    'owner_role': self._owner_role_display(),
+                    'year': self._year_display(),
+                    'data': self._data_display(),
+                }
+            # force evaluation of lazy objects
+            display[lang] = json.loads(json.dumps(values, cls=JSONEncoder))
+        self.display = display
+
+    def update_years(self):
+        years = []
+        if self.type and self.type.get('source') and self.data:
+            schema = get_schema_instance(self.type['source'])
+            if schema:
+                for fld in schema.date_fields:
+                    years += years_list_from_date_field(self.data.get(fld))
+        self.years = sorted(set(years))
+
+    def update_category(self):
+        self.category = get_category(
+            self.type.get('source') if self.type else None,
+            self.data,
+            self.owner.username,
+        )
+
     @property
     def location_display(self):
+        return self._get_display('location')
+
+    @property
+    def owner_role_display(self):
+        return self._get_display('owner_role')
+
+    @property
+    def year_display(self):
+        return self._get_display('year')
+
+    @property
+    def data_display(self):
+        return self._get_display('data')
+
+    def _location_display(self):
         if self.type and self.type.get('source'):
-            schema = get_schema(self.type['source'])
+            schema = get_schema_instance(self.type['source'])
             data = self.data
             if schema and data:
-                return schema().location_display(data)
+                return schema.location_display(data)
 
-    @property
-    def owner_role_display(self):
+    def _owner_role_display(self):
         if self.type and self.type.get('source'):
-            schema = get_schema(self.type['source'])
+            schema = get_schema_instance(self.type['source'])
             data = self.data
             if schema and data:
-                return schema().role_display(data, self.owner.username)
+                return schema.role_display(data, self.owner.username)
 
-    @property
-    def year_display(self):
+    def _year_display(self):
         if self.type and self.type.get('source'):
-            schema = get_schema(self.type['source'])
+            schema = get_schema_instance(self.type['source'])
             data = self.data
             if schema and data:
-                return schema().year_display(data)
+                return schema.year_display(data)
 
-    @property
-    def data_display(self):
+    def _data_display(self):
         ret = {
             'id': self.id,
             'data': [],
@@ -140,28 +279,23 @@ class Entry(AbstractBaseModel):
             if texts:
                 ret['data'].append({'label': get_altlabel_lazy('text'), 'value': texts})
         if self.type:
-            schema = get_schema(self.type.get('source'))
+            schema = get_schema_instance(self.type.get('source'))
             data = self.data
             if schema and data:
-                ret['data'] += schema().data_display(data)
+                ret['data'] += schema.data_display(data)
         return ret
 
     def clean(self):
         if self.type:
             if self.data:
-                schema = get_jsonschema(self.type.get('source'), force_text=True)
-                if schema is None:
+                validator = get_entry_validator(self.type.get('source'))
+                if validator is None:
                     msg = _(
                         'Type %(type_source)s does not belong to any active schema'
                     ) % {'type_source': self.type.get('source')}
                     raise ValidationError(msg)
                 try:
-                    validate(
-                        self.data,
-                        schema,
-                        cls=Draft4Validator,
-                        format_checker=FormatChecker(),
-                    )
+                    run_validator(validator, self.data)
                 except SchemaValidationError as e:
                     msg = _('Invalid data: %(error)s') % {
                         'error': e.message
@@ -215,7 +349,221 @@ class Relation(AbstractBaseModel):
             raise ValidationError(_('Both entries must belong to the same user'))
 
 
+class EntryContributor(models.Model):
+    """Contributor of an entry, derived from the contributor fields of its data.
+
+    There is one row per role of a contributor in a field (or a single row
+    without role, if no roles are set). The table is kept in sync whenever an
+    entry is saved and can be rebuilt with the rebuild_contributors command.
+    """
+
+    entry = models.ForeignKey(
+        Entry,
+        related_name='contributor_index',
+        on_delete=models.CASCADE,
+    )
+    source = models.CharField(max_length=255)
+    field = models.CharField(max_length=255)
+    role = models.CharField(max_length=255, blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['source', 'field'], name='core_contrib_source_field_idx'
+            ),
+            models.Index(
+                fields=['source', 'role'], name='core_contrib_source_role_idx'
+            ),
+        ]
+
+    @classmethod
+    def for_entry(cls, entry):
+        """Return unsaved contributor rows for an entry."""
+        data = entry.data or {}
+        ret = []
+        # contributor fields of all schemas are considered, since the data
+        # may still contain fields of a previous type of the entry
+        for fld in CONTRIBUTORS_FIELDS:
+            for contributor in data.get(fld) or []:
+                if not isinstance(contributor, dict) or not contributor.get('source'):
+                    continue
+                roles = [
+                    r['source']
+                    for r in contributor.get('roles') or []
+                    if isinstance(r, dict) and r.get('source')
+                ]
+                for role in roles or [None]:
+                    ret.append(
+                        cls(
+                            entry_id=entry.pk,
+                            source=contributor['source'],
+                            field=fld,
+                            role=role,
+                        )
+                    )
+        return ret
+
+    @classmethod
+    def update_for_entry(cls, entry):
+        """Replace the contributor rows of an entry and return the new ones."""
+        cls.objects.filter(entry_id=entry.pk).delete()
+        return cls.objects.bulk_create(cls.for_entry(entry))
+
+
+class EntryReport(models.Model):
+    """Published entry per contributor, field, role and year, for reporting.
+
+    The rows are derived from the contributors and years of published entries,
+    updated whenever an entry is saved and rebuilt every night, see
+    core.reporting.rebuild_reports.
+    """
+
+    entry = models.ForeignKey(
+        Entry,
+        related_name='reports',
+        on_delete=models.CASCADE,
+    )
+    type = models.CharField(max_length=255)
+    source = models.CharField(max_length=255)
+    field = models.CharField(max_length=255)
+    role = models.CharField(max_length=255, blank=True, null=True)
+    year = models.IntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['year', 'source', 'field'], name='core_report_year_source_idx'
+            ),
+            models.Index(fields=['year', 'type'], name='core_report_year_type_idx'),
+        ]
+
+    @classmethod
+    def for_entry(cls, entry):
+        """Return unsaved report rows for an entry."""
+        if not entry.published or not entry.type or not entry.type.get('source'):
+            return []
+        return [
+            cls(
+                entry_id=entry.pk,
+                type=entry.type['source'],
+                source=c.source,
+                field=c.field,
+                role=c.role,
+                year=year,
+            )
+            for c in EntryContributor.for_entry(entry)
+            for year in entry.years or []
+        ]
+
+    @classmethod
+    def update_for_entry(cls, entry):
+        """Replace the report rows of an entry."""
+        cls.objects.filter(entry_id=entry.pk).delete()
+        cls.objects.bulk_create(cls.for_entry(entry))
+
+
+# sections of the profile data of users per category, see api.views.user_data
+user_data_cache = GenerationCache('user_data', 86400)
+
+# generation of the profile data of all users
+ALL_USERS = '*'
+
+
+def get_user_data_generations(username, category):
+    """Return the generations a section of the profile data of a user depends on."""
+    return [ALL_USERS, username, f'{username}__{category}']
+
+
+def invalidate_user_data(usernames=None):
+    """Invalidate the cached profile data of users, or of all users.
+
+    The data is invalidated as soon as the current transaction is committed.
+    """
+    names = [ALL_USERS] if usernames is None else list(usernames)
+    if names:
+        transaction.on_commit(lambda: user_data_cache.bump(*names))
+
+
+def invalidate_user_data_categories(username, categories):
+    """Invalidate the cached sections of some categories of a user's profile data."""
+    names = [f'{username}__{c or DEFAULT_CATEGORY}' for c in set(categories)]
+    transaction.on_commit(lambda: user_data_cache.bump(*names))
+
+
+def get_entry_usernames(entry):
+    """Return the usernames of the owner and the indexed contributors of an entry."""
+    return {
+        entry.owner.username,
+        *EntryContributor.objects.filter(entry_id=entry.pk).values_list(
+            'source', flat=True
+        ),
+    }
+
+
+@receiver(connection_created, dispatch_uid='set_word_similarity_threshold')
+def set_word_similarity_threshold(sender, connection, *args, **kwargs):
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SET pg_trgm.word_similarity_threshold = %s', [SEARCH_RANK_THRESHOLD]
+            )
+
+
+@receiver(pre_save, sender=Entry, dispatch_uid='entry_pre_save')
+def entry_pre_save(sender, instance, *args, **kwargs):
+    update_fields = kwargs.get('update_fields')
+    if kwargs.get('raw'):
+        return
+    # keep the previous category, to invalidate its section of the profile
+    instance._previous_category = instance.category
+    if update_fields is None or 'display' in update_fields:
+        instance.update_display()
+    if update_fields is None or 'years' in update_fields:
+        instance.update_years()
+    if update_fields is None or 'category' in update_fields:
+        instance.update_category()
+
+
+@receiver(post_save, sender=Entry, dispatch_uid='entry_post_save')
+def entry_post_save(sender, instance, created, *args, **kwargs):
+    if kwargs.get('raw'):
+        return
+    # includes the contributors before the update
+    usernames = get_entry_usernames(instance)
+    update_fields = kwargs.get('update_fields')
+    if update_fields is None or 'data' in update_fields:
+        contributors = EntryContributor.update_for_entry(instance)
+        usernames.update(c.source for c in contributors)
+    if update_fields is None or {'data', 'published', 'type', 'years'} & set(
+        update_fields
+    ):
+        EntryReport.update_for_entry(instance)
+
+    # only the sections of the previous and the current category of the entry
+    # have to be recomputed for the profile of its owner
+    owner = instance.owner.username
+    categories = {instance.category}
+    if not created:
+        categories.add(getattr(instance, '_previous_category', None))
+    invalidate_user_data_categories(owner, categories)
+    invalidate_user_data(usernames - {owner})
+
+
+@receiver(pre_delete, sender=Entry, dispatch_uid='entry_pre_delete')
+def entry_pre_delete(sender, instance, *args, **kwargs):
+    owner = instance.owner.username
+    invalidate_user_data_categories(owner, [instance.category])
+    invalidate_user_data(get_entry_usernames(instance) - {owner})
+
+
 @receiver(pre_save, sender=Relation, dispatch_uid='relation_pre_save')
 def relation_pre_save(sender, instance, *args, **kwargs):
     # ensure that there's only one relation between two entries
     instance.to_entry.remove_relation(instance.from_entry)
+
+
+@receiver(post_save, sender=Relation, dispatch_uid='relation_post_save')
+@receiver(post_delete, sender=Relation, dispatch_uid='relation_post_delete')
+def relation_changed(sender, instance, *args, **kwargs):
+    if not kwargs.get('raw'):
+        invalidate_user_data([instance.from_entry.owner.username])
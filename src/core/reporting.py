@@ -0,0 +1,39 @@
+import logging
+
+from django.db import transaction
+
+from .models import Entry, EntryReport
+
+logger = logging.getLogger(__name__)
+
+
+def rebuild_reports(batch_size=500):
+    """Rebuild the report rows of all published entries.
+
+    The rows are usually updated whenever an entry is saved, rebuilding them
+    repairs rows which got out of sync, e.g. by bulk updates.
+    """
+    count = 0
+    batch = []
+
+    entries = Entry.objects.filter(published=True).only(
+        'id', 'type', 'data', 'published', 'years'
+    )
+
+    with transaction.atomic():
+        EntryReport.objects.all().delete()
+
+        for e in entries.iterator(chunk_size=batch_size):
+            batch += EntryReport.for_entry(e)
+            if len(batch) >= batch_size:
+                EntryReport.objects.bulk_create(batch)
+                count += len(batch)
+                batch = []
+
+        if batch:
+            EntryReport.objects.bulk_create(batch)
+            count += len(batch)
+
+    logger.info('Rebuilt %s report rows', count)
+
+    return count
@@ -2,15 +2,18 @@ import importlib
 import json
 
 from apispec.ext.marshmallow.openapi import OpenAPIConverter
+from jsonschema import Draft4Validator, FormatChecker
+from jsonschema.exceptions import best_match
 from rest_framework.utils.encoders import JSONEncoder
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.templatetags.static import static
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import get_language, gettext_lazy as _
 
-from ..skosmos import get_preflabel, get_preflabel_lazy
+from ..skosmos import get_preflabel_lazy, label_cache
 from .models import KeywordsModelSchema, TextsModelSchema, TypeModelSchema
+from .snapshot import get_type_labels
 
 ICON_DEFAULT = static('img/sheet-empty.svg')
 ICON_EVENT = static('img/calendar-many.svg')
@@ -20,15 +23,25 @@ ACTIVE_TYPES = []
 ACTIVE_TYPES_CHOICES = []
 ACTIVE_TYPES_LIST = []
 
+ACTIVE_SCHEMA_INSTANCES = []
+
+# names of the contributor fields of all active schemas
+CONTRIBUTORS_FIELDS = []
+
+# maps each active type to its schema, a shared instance of it and its icon
+TYPES_REGISTRY = {}
+
+# compiled validators per schema and language, for the current label version
+_validators = {}
+_validators_version = None
+
 
 def init():
     if not settings.OPEN_API_VERSION or not settings.ACTIVE_SCHEMAS:
         raise ImproperlyConfigured(_('Schemas improperly configured'))
 
-    global ACTIVE_TUPLES
+    # the other registries are only mutated in place
     global ACTIVE_TYPES
-    global ACTIVE_TYPES_CHOICES
-    global ACTIVE_TYPES_LIST
 
     for schema in settings.ACTIVE_SCHEMAS:
         s = importlib.import_module(f'.entries.{schema}', __name__)
@@ -46,6 +59,8 @@ def init():
         )
         ACTIVE_TYPES += [*s.TYPES]
 
+    labels = get_type_labels(ACTIVE_TYPES)
+
     for i in ACTIVE_TYPES:
         ACTIVE_TYPES_CHOICES.append(
             [
@@ -58,29 +73,20 @@ def init():
             ]
         )
 
-        ACTIVE_TYPES_LIST.append(
-            {
-                'source': i,
-                'label': {
-                    'de': get_preflabel(
-                        i.split('/')[-1],
-                        project=settings.TAX_ID,
-                        graph=settings.TAX_GRAPH,
-                        lang='de',
-                    ),
-                    'en': get_preflabel(
-                        i.split('/')[-1],
-                        project=settings.TAX_ID,
-                        graph=settings.TAX_GRAPH,
-                        lang='en',
-                    ),
-                },
-            }
-        )
+        ACTIVE_TYPES_LIST.append({'source': i, 'label': labels[i]})
 
     if len(set(ACTIVE_TYPES)) < len(ACTIVE_TYPES):
         raise ImproperlyConfigured(_('Active schemas contain duplicate types'))
 
+    for types, schema, icon in ACTIVE_TUPLES:
+        instance = schema()
+        ACTIVE_SCHEMA_INSTANCES.append(instance)
+        for t in types:
+            TYPES_REGISTRY[t] = (schema, instance, icon)
+        for fld in instance.contributors_fields:
+            if fld not in CONTRIBUTORS_FIELDS:
+                CONTRIBUTORS_FIELDS.append(fld)
+
 
 init()
 
@@ -98,27 +104,38 @@ def schema2jsonschema(schema, force_text=False):
 
 
 def get_jsonschema(entry_type, force_text=False):
-    for types, schema, _icon in ACTIVE_TUPLES:
-        if entry_type in types:
-            return schema2jsonschema(schema, force_text)
+    if entry_type in TYPES_REGISTRY:
+        return schema2jsonschema(TYPES_REGISTRY[entry_type][0], force_text)
 
 
 def get_schema(entry_type):
-    for types, schema, _icon in ACTIVE_TUPLES:
-        if entry_type in types:
-            return schema
+    if entry_type in TYPES_REGISTRY:
+        return TYPES_REGISTRY[entry_type][0]
+
+
+def get_schema_instance(entry_type):
+    """Return a shared instance of the schema of a type.
+
+    The instance must not be modified, as it is used for all entries of all
+    types belonging to the schema.
+    """
+    if entry_type in TYPES_REGISTRY:
+        return TYPES_REGISTRY[entry_type][1]
 
 
 def get_icon(entry_type):
-    for types, _schema, icon in ACTIVE_TUPLES:
-        if entry_type in types:
-            return icon
+    if entry_type in TYPES_REGISTRY:
+        return TYPES_REGISTRY[entry_type][2]
 
 
 def get_active_schemas():
     return [schema for _types, schema, _icon in ACTIVE_TUPLES]
 
 
+def get_active_schema_instances():
+    return ACTIVE_SCHEMA_INSTANCES
+
+
 def get_type_jsonschema():
     return schema2jsonschema(TypeModelSchema, force_text=True)['properties']['type']
 
@@ -131,3 +148,55 @@ def get_keywords_jsonschema():
 
 def get_texts_jsonschema():
     return schema2jsonschema(TextsModelSchema, force_text=True)['properties']['texts']
+
+
+def _get_validator(key, get_jsonschema_func):
+    global _validators
+    global _validators_version
+
+    # jsonschemas contain labels, so validators have to be rebuilt as soon as
+    # labels change
+    version = label_cache.version
+    if version != _validators_version:
+        _validators = {}
+        _validators_version = version
+
+    cache_key = (key, get_language() or 'en')
+    validator = _validators.get(cache_key)
+    if validator is None:
+        jsonschema = get_jsonschema_func()
+        if jsonschema is None:
+            return None
+        Draft4Validator.check_schema(jsonschema)
+        validator = Draft4Validator(jsonschema, format_checker=FormatChecker())
+        _validators[cache_key] = validator
+    return validator
+
+
+def get_entry_validator(entry_type):
+    return _get_validator(
+        entry_type, lambda: get_jsonschema(entry_type, force_text=True)
+    )
+
+
+def get_type_validator():
+    return _get_validator('type', get_type_jsonschema)
+
+
+def get_keywords_validator():
+    return _get_validator('keywords', get_keywords_jsonschema)
+
+
+def get_texts_validator():
+    return _get_validator('texts', get_texts_jsonschema)
+
+
+def run_validator(validator, instance):
+    """Validate an instance like jsonschema.validate does.
+
+    Raises the best matching jsonschema ValidationError if the instance is
+    invalid.
+    """
+    error = best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
@@ -1,5 +1,4 @@
 from ...schemas import ICON_EVENT
-from ...skosmos import get_collection_members
 from ..base import BaseSchema
 from ..general import (
     get_contributors_field,
@@ -7,14 +6,12 @@ from ..general import (
     get_date_range_time_range_location_group_field,
     get_url_field,
 )
+from ..snapshot import get_types
 from ..utils import years_from_date_range_time_range_location_group_field
 
 ICON = ICON_EVENT
 
-TYPES = get_collection_members(
-    'http://base.uni-ak.ac.at/portfolio/taxonomy/collection_conference',
-    use_cache=False,
-)
+TYPES = get_types('http://base.uni-ak.ac.at/portfolio/taxonomy/collection_conference')
 
 
 class ConferenceSchema(BaseSchema):
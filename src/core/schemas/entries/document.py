@@ -1,6 +1,6 @@
 from marshmallow import fields
 
-from ...skosmos import get_collection_members, get_preflabel_lazy
+from ...skosmos import get_preflabel_lazy
 from ..base import BaseSchema
 from ..general import (
     get_contributors_field,
@@ -13,11 +13,11 @@ from ..general import (
     get_string_field,
     get_url_field,
 )
+from ..snapshot import get_types
 from ..utils import year_from_date
 
-TYPES = get_collection_members(
-    'http://base.uni-ak.ac.at/portfolio/taxonomy/collection_document_publication',
-    use_cache=False,
+TYPES = get_types(
+    'http://base.uni-ak.ac.at/portfolio/taxonomy/collection_document_publication'
 )
 
 
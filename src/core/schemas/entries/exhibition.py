@@ -4,7 +4,7 @@ from django.utils.text import format_lazy
 from django.utils.translation import gettext_lazy as _
 
 from ...schemas import ICON_EVENT
-from ...skosmos import get_collection_members, get_preflabel_lazy
+from ...skosmos import get_preflabel_lazy
 from ..base import BaseSchema
 from ..general import (
     DateTimeLocationModel,
@@ -16,14 +16,12 @@ from ..general import (
     get_location_field,
     get_url_field,
 )
+from ..snapshot import get_types
 from ..utils import years_list_from_date_range, years_to_string
 
 ICON = ICON_EVENT
 
-TYPES = get_collection_members(
-    'http://base.uni-ak.ac.at/portfolio/taxonomy/collection_exhibition',
-    use_cache=False,
-)
+TYPES = get_types('http://base.uni-ak.ac.at/portfolio/taxonomy/collection_exhibition')
 
 
 class DateOpeningLocationSchema(BaseSchema):
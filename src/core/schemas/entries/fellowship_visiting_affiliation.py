@@ -1,18 +1,17 @@
 from ...schemas import ICON_EVENT
-from ...skosmos import get_collection_members
 from ..base import BaseSchema
 from ..general import (
     get_contributors_field,
     get_contributors_field_for_role,
     get_date_range_location_group_field,
 )
+from ..snapshot import get_types
 from ..utils import years_from_date_range_location_group_field
 
 ICON = ICON_EVENT
 
-TYPES = get_collection_members(
-    'http://base.uni-ak.ac.at/portfolio/taxonomy/collection_fellowship_visiting_affiliation',
-    use_cache=False,
+TYPES = get_types(
+    'http://base.uni-ak.ac.at/portfolio/taxonomy/collection_fellowship_visiting_affiliation'
 )
 
 
@@ -1,4 +1,3 @@
-from ...skosmos import get_collection_members
 from ..base import BaseSchema
 from ..general import (
     get_contributors_field,
@@ -9,12 +8,10 @@ from ..general import (
     get_material_field,
     get_url_field,
 )
+from ..snapshot import get_types
 from ..utils import years_from_date_location_group_field
 
-TYPES = get_collection_members(
-    'http://base.uni-ak.ac.at/portfolio/taxonomy/collection_image',
-    use_cache=False,
-)
+TYPES = get_types('http://base.uni-ak.ac.at/portfolio/taxonomy/collection_image')
 
 
 class ImageSchema(BaseSchema):
@@ -2,7 +2,7 @@ from marshmallow import fields
 
 from django.urls import reverse_lazy
 
-from ...skosmos import get_collection_members, get_preflabel_lazy
+from ...skosmos import get_preflabel_lazy
 from ...utils import placeholder_lazy
 from ..base import BaseSchema
 from ..general import (
@@ -14,12 +14,10 @@ from ..general import (
     get_string_field,
     get_url_field,
 )
+from ..snapshot import get_types
 from ..utils import year_from_date
 
-TYPES = get_collection_members(
-    'http://base.uni-ak.ac.at/portfolio/taxonomy/collection_software',
-    use_cache=False,
-)
+TYPES = get_types('http://base.uni-ak.ac.at/portfolio/taxonomy/collection_software')
 
 
 class SoftwareSchema(BaseSchema):
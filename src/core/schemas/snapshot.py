@@ -0,0 +1,110 @@
+import json
+import logging
+
+from django.conf import settings
+from django.utils import timezone
+
+from ..skosmos import get_collection_members, get_preflabels
+from ..utils import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+# collections used by the entry schemas, registered when they are imported
+COLLECTIONS = []
+
+_snapshot = None
+
+
+def load_snapshot():
+    """Return the schema snapshot or an empty one if it is not available.
+
+    The snapshot holds the types of all collections used by the entry schemas
+    and the labels of all types, so that the schemas can be initialised
+    without any requests to SKOSMOS. It is only loaded once per process.
+    """
+    global _snapshot
+
+    if _snapshot is None:
+        _snapshot = {'collections': {}, 'labels': {}}
+        try:
+            with open(settings.SCHEMA_SNAPSHOT_PATH) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            logger.warning(
+                'Schema snapshot %s not found, falling back to SKOSMOS',
+                settings.SCHEMA_SNAPSHOT_PATH,
+            )
+        except (OSError, ValueError):
+            logger.exception(
+                'Could not load schema snapshot %s', settings.SCHEMA_SNAPSHOT_PATH
+            )
+        else:
+            if data.get('version') == SNAPSHOT_FORMAT_VERSION:
+                _snapshot = data
+            else:
+                logger.warning(
+                    'Ignoring schema snapshot %s with unsupported version %s',
+                    settings.SCHEMA_SNAPSHOT_PATH,
+                    data.get('version'),
+                )
+
+    return _snapshot
+
+
+def get_types(collection):
+    """Return the types of an entry schema collection."""
+    if collection not in COLLECTIONS:
+        COLLECTIONS.append(collection)
+
+    types = load_snapshot()['collections'].get(collection)
+    if types is None:
+        types = get_collection_members(collection, use_cache=False)
+    return types
+
+
+def get_type_labels(types):
+    """Return the labels of the given types in all languages."""
+    langs = [lang for lang, _name in settings.LANGUAGES]
+
+    snapshot_labels = load_snapshot()['labels']
+    labels = {t: snapshot_labels[t] for t in types if t in snapshot_labels}
+
+    missing = [t for t in types if t not in labels]
+    if missing:
+        labels.update(get_preflabels(missing, langs, project=settings.TAX_ID))
+
+    return labels
+
+
+def update_snapshot():
+    """Write a new schema snapshot with the current data from the vocabularies.
+
+    Running processes keep using the snapshot they have loaded, the new one is
+    used as soon as they are restarted.
+    """
+    # make sure all entry schemas have registered their collections
+    from . import ACTIVE_TYPES  # noqa: F401
+
+    langs = [lang for lang, _name in settings.LANGUAGES]
+
+    collections = {}
+    for collection in COLLECTIONS:
+        types = get_collection_members(collection, use_cache=False)
+        if not types:
+            raise ValueError(f'No types found for collection {collection}')
+        collections[collection] = types
+
+    types = list({t for ts in collections.values() for t in ts})
+
+    data = {
+        'version': SNAPSHOT_FORMAT_VERSION,
+        'created': timezone.now().isoformat(),
+        'collections': collections,
+        'labels': get_preflabels(types, langs, project=settings.TAX_ID),
+    }
+
+    write_json_atomic(settings.SCHEMA_SNAPSHOT_PATH, data)
+
+    return len(types)
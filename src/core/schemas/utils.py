@@ -82,3 +82,32 @@ def years_from_date_range_location_group_field(drlg) -> str:
 
 def years_from_date_range_time_range_location_group_field(drtrlg) -> str:
     return years_from_date_range_location_group_field(drtrlg)
+
+
+def years_list_from_date_field(value) -> List[int]:
+    """Return all years covered by the value of a date field.
+
+    Handles dates, date ranges and groups of them, also nested in dicts with
+    a ``date`` key (e.g. date location groups). Date ranges cover all years
+    from their start to their end. Invalid dates are ignored.
+    """
+    years = []
+    if isinstance(value, str):
+        try:
+            years.append(int(year_from_date_string(value)))
+        except ValueError:
+            pass
+    elif isinstance(value, (date, datetime)):
+        years.append(value.year)
+    elif isinstance(value, list):
+        for v in value:
+            years += years_list_from_date_field(v)
+    elif isinstance(value, dict):
+        if 'date_from' in value or 'date_to' in value:
+            try:
+                years += [int(y) for y in years_list_from_date_range(value)]
+            except ValueError:
+                pass
+        elif 'date' in value:
+            years += years_list_from_date_field(value['date'])
+    return sorted(set(years))
@@ -1,18 +1,45 @@
 import hashlib
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
 
+import django_rq
 import requests
 from rdflib.namespace import SKOS
-from requests import RequestException
+from requests import HTTPError, RequestException
+from requests.adapters import HTTPAdapter
 from skosmos_client import SkosmosClient
 
 from django.conf import settings
 from django.core.cache import cache
+from django.utils import translation
 from django.utils.functional import lazy
+from django.utils.module_loading import import_string
 from django.utils.translation import get_language
 
-from .utils import unaccent
+from general.cache import StaleCache, TwoTierCache
+from general.circuitbreaker import CircuitBreaker
+
+from .vocabulary import VocabularyIndex, VocabularyMirror, sync_mirror
+
+logger = logging.getLogger(__name__)
 
 CACHE_TIME = 86400  # 1 day
+STALE_CACHE_TIME = 604800  # 7 days
+PARTIAL_CACHE_TIME = 300  # 5 minutes
+NEGATIVE_CACHE_TIME = 300  # 5 minutes
+LABEL_REQUEST_TIMEOUT = 10  # seconds
+VOCABULARY_REFRESH_LOCK_KEY = 'refresh_vocabularies_lock'
+VOCABULARY_REFRESH_SCHEDULED_KEY = 'refresh_vocabularies_scheduled'
+VOCABULARY_REFRESH_LOCK_TIME = 3600  # 1 hour
+COLLECTIONS_CACHE_KEY = 'get_collection_members__collections'
+VOCABULARY_VERSION_KEY = 'vocabulary__version'
+VOCABULARY_VERSION_CHECK_INTERVAL = 30  # seconds
+FETCH_CHILDREN_WORKERS = 8
+FETCH_CHILDREN_DEADLINE = 15  # seconds
+LABEL_CACHE_LOCAL_TIME = 3600  # 1 hour
+LABEL_CACHE_MAXSIZE = 20000
+LABEL_FETCH_WORKERS = 8
 
 PROJECT_MAPPING = {
     'http://base.uni-ak.ac.at/portfolio/languages/': 'languages',
@@ -26,22 +53,103 @@ PROJECT_MAPPING = {
 
 skosmos = SkosmosClient(api_base=settings.SKOSMOS_API)
 
+# pooled session for direct requests to the SKOSMOS API
+session = requests.Session()
+session.mount(
+    settings.SKOSMOS_API,
+    HTTPAdapter(pool_connections=1, pool_maxsize=FETCH_CHILDREN_WORKERS),
+)
+
+# one circuit breaker per SKOSMOS endpoint, so that an outage does not lead to
+# chains of timeouts in request threads
+breakers = {
+    endpoint: CircuitBreaker(f'skosmos_{endpoint}')
+    for endpoint in ('data', 'label', 'search', 'topConcepts')
+}
 
-def autosuggest(data, query, language=None):
+mirror = VocabularyMirror(settings.VOCABULARY_MIRROR_PATH)
+
+# labels are evaluated very often (e.g. lazy verbose names and schema titles), so
+# they are kept in a per-process cache in front of Redis
+label_cache = TwoTierCache(
+    'labels',
+    maxsize=LABEL_CACHE_MAXSIZE,
+    local_timeout=LABEL_CACHE_LOCAL_TIME,
+)
+
+# vocabularies are served stale after CACHE_TIME while they are refreshed in the
+# background, and only dropped after STALE_CACHE_TIME
+vocabulary_cache = StaleCache(
+    'vocabulary',
+    soft_timeout=CACHE_TIME,
+    hard_timeout=STALE_CACHE_TIME,
+)
+
+
+# per process autosuggest indexes, mapping (source, language) to the vocabulary
+# version and the index
+_indexes = {}
+_vocabulary_version = None
+_vocabulary_version_checked = None
+
+
+def get_vocabulary_version():
+    global _vocabulary_version
+    global _vocabulary_version_checked
+
+    now = time.monotonic()
+    if (
+        _vocabulary_version_checked is None
+        or now - _vocabulary_version_checked > VOCABULARY_VERSION_CHECK_INTERVAL
+    ):
+        _vocabulary_version = cache.get(VOCABULARY_VERSION_KEY, 0)
+        _vocabulary_version_checked = now
+    return _vocabulary_version
+
+
+def bump_vocabulary_version():
+    try:
+        cache.incr(VOCABULARY_VERSION_KEY)
+    except ValueError:
+        cache.set(VOCABULARY_VERSION_KEY, 1, None)
+
+
+def get_vocabulary_index(source, language):
+    """Return the autosuggest index for a vocabulary source in a language.
+
+    The source is the import path of a function returning the vocabulary. The
+    index is built once per process and rebuilt after the vocabularies have
+    been refreshed.
+    """
+    version = get_vocabulary_version()
+    version_index = _indexes.get((source, language))
+    if version_index is None or version_index[0] != version:
+        version_index = (version, VocabularyIndex(import_string(source)(), language))
+        _indexes[(source, language)] = version_index
+    return version_index[1]
+
+
+def autosuggest_source(source, query, language=None, limit=None):
     if not language:
         language = get_language() or 'en'
 
-    query = unaccent(query.lower())
+    return get_vocabulary_index(source, language).search(query, limit)
 
-    result = list(
-        filter(
-            lambda d: query
-            in unaccent(d['label'].get(language, d['label'].get('en', '')).lower()),
-            data,
+
+def skosmos_get(endpoint, url, params, timeout=settings.REQUESTS_TIMEOUT):
+    def request():
+        start = time.monotonic()
+        req = session.get(url, params=params, timeout=timeout)
+        logger.debug(
+            'Requested %s in %.3fs (status %s)',
+            url,
+            time.monotonic() - start,
+            req.status_code,
         )
-    )
+        req.raise_for_status()
+        return req.json()
 
-    return result
+    return breakers[endpoint].call(request)
 
 
 def get_json_data(uri, vocid=None):
@@ -52,14 +160,7 @@ def get_json_data(uri, vocid=None):
     else:
         url = settings.SKOSMOS_API + 'data'
 
-    req = requests.get(
-        url,
-        params=payload,
-        timeout=settings.REQUESTS_TIMEOUT,
-    )
-    req.raise_for_status()
-
-    return req.json()
+    return skosmos_get('data', url, payload)
 
 
 def get_search_data(uri):
@@ -72,16 +173,66 @@ def get_search_data(uri):
         'unique': 'true',
     }
 
-    req = requests.get(
-        settings.SKOSMOS_API + 'search',
-        params=payload,
-        timeout=settings.REQUESTS_TIMEOUT,
-    )
-    req.raise_for_status()
-    return req.json()['results']
+    return skosmos_get('search', settings.SKOSMOS_API + 'search', payload)['results']
+
+
+def get_children_search_data(uris):
+    """Fetch the children of several concepts concurrently.
+
+    Returns a dict mapping each concept URI to its children and a flag
+    indicating whether all of them could be fetched before the deadline.
+    """
+    ret = {}
+    executor = ThreadPoolExecutor(max_workers=FETCH_CHILDREN_WORKERS)
+    futures = {executor.submit(get_search_data, uri): uri for uri in uris}
+    try:
+        for future in as_completed(futures, timeout=FETCH_CHILDREN_DEADLINE):
+            try:
+                ret[futures[future]] = future.result()
+            except RequestException:
+                logger.warning('Could not fetch children of %s', futures[future])
+    except TimeoutError:
+        logger.warning(
+            'Fetching children took longer than %ss, returning partial results',
+            FETCH_CHILDREN_DEADLINE,
+        )
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+    return ret, len(ret) == len(futures)
+
+
+def get_cached_vocabulary(cache_key, build, refresh=False):
+    """Return a vocabulary from the cache or build it.
+
+    Stale values are returned as they are and a background refresh is
+    scheduled. ``build`` has to return the value and whether it is complete,
+    incomplete values are only cached for a short time.
+    """
+    previous, stale = vocabulary_cache.get(cache_key)
+    if not refresh and previous:
+        if stale:
+            schedule_vocabulary_refresh()
+        return previous
+
+    value, complete = build()
+
+    if value:
+        vocabulary_cache.set(cache_key, value, None if complete else PARTIAL_CACHE_TIME)
+        if value != previous:
+            # autosuggest indexes and everything else derived from the
+            # vocabularies need to be rebuilt
+            bump_vocabulary_version()
+
+    return value
+
 
+def fetch_data(uri, vocid=None, fetch_children=False, source_name=None, refresh=False):
+    return _fetch_data(uri, vocid, fetch_children, source_name, refresh)[0]
 
-def fetch_data(uri, vocid=None, fetch_children=False, source_name=None):
+
+def _fetch_data(uri, vocid=None, fetch_children=False, source_name=None, refresh=False):
     language = get_language() or 'en'
 
     cache_key = hashlib.md5(  # nosec
@@ -90,9 +241,10 @@ def fetch_data(uri, vocid=None, fetch_children=False, source_name=None):
         ).encode('utf-8')
     ).hexdigest()
 
-    data = cache.get(cache_key, [])
+    def build():
+        data = []
+        complete = True
 
-    if not data:
         d = get_json_data(uri, vocid)
 
         for i in d['graph']:
@@ -106,58 +258,57 @@ def fetch_data(uri, vocid=None, fetch_children=False, source_name=None):
                     md['source_name'] = source_name
                 data.append(md)
 
-                if fetch_children:
-                    cd = get_search_data(i['uri'])
-                    for ci in cd:
-                        cmd = {'source': ci['uri'], 'label': ci['prefLabels']}
-                        if source_name:
-                            cmd['source_name'] = source_name
-                        data.append(cmd)
+        if fetch_children:
+            children, complete = get_children_search_data([md['source'] for md in data])
+            for cd in children.values():
+                for ci in cd:
+                    cmd = {'source': ci['uri'], 'label': ci['prefLabels']}
+                    if source_name:
+                        cmd['source_name'] = source_name
+                    data.append(cmd)
+
+        if not data:
+            return None, complete
 
-        if data:
-            data = sorted(
-                data,
-                key=lambda x: x.get('label', {})
-                .get(language, x.get('label', {}).get('en', 'zzz'))
-                .lower(),
-            )
-            cache.set(cache_key, data, CACHE_TIME)
+        data = sorted(
+            data,
+            key=lambda x: x.get('label', {})
+            .get(language, x.get('label', {}).get('en', 'zzz'))
+            .lower(),
+        )
+        return (data, complete), complete
 
-    return data
+    return get_cached_vocabulary(cache_key, build, refresh) or ([], True)
 
 
-def get_base_keywords():
+def get_base_keywords(refresh=False):
     return fetch_data(
         'http://base.uni-ak.ac.at/recherche/keywords/collection_base',
         source_name='base',
+        refresh=refresh,
     )
 
 
-def get_disciplines():
-    cache_key = 'get_disciplines'
-
-    data = cache.get(cache_key, [])
-
-    if not data:
+def get_disciplines(refresh=False):
+    def build():
+        disciplines, complete = _fetch_data(
+            'http://base.uni-ak.ac.at/portfolio/disciplines/oefos',
+            fetch_children=True,
+            source_name='voc',
+            refresh=refresh,
+        )
         data = list(
-            filter(
-                lambda x: len(x['source'].split('/')[-1]) % 3 == 0,
-                fetch_data(
-                    'http://base.uni-ak.ac.at/portfolio/disciplines/oefos',
-                    fetch_children=True,
-                    source_name='voc',
-                ),
-            )
+            filter(lambda x: len(x['source'].split('/')[-1]) % 3 == 0, disciplines)
         )
+        return data, complete
 
-        if data:
-            cache.set(cache_key, data, CACHE_TIME)
-
-    return data
+    return get_cached_vocabulary('get_disciplines', build, refresh) or []
 
 
-def get_formats():
-    return fetch_data('http://base.uni-ak.ac.at/portfolio/vocabulary/format_type')
+def get_formats(refresh=False):
+    return fetch_data(
+        'http://base.uni-ak.ac.at/portfolio/vocabulary/format_type', refresh=refresh
+    )
 
 
 def get_keywords():
@@ -167,86 +318,85 @@ def get_keywords():
     ]
 
 
-def get_languages():
-    return fetch_data('http://base.uni-ak.ac.at/portfolio/languages/iso_639_1')
+def get_languages(refresh=False):
+    return fetch_data(
+        'http://base.uni-ak.ac.at/portfolio/languages/iso_639_1', refresh=refresh
+    )
 
 
-def get_languages_choices():
+def get_languages_choices(refresh=False):
     language = get_language() or 'en'
-    cache_key_languages = f'get_languages_{language}'
-    cache_key_languages_labels = f'get_languages_labels_{language}'
-
-    languages = cache.get(cache_key_languages, [])
-    languages_labels = cache.get(cache_key_languages_labels, [])
 
-    if not languages or not languages_labels:
-        r = skosmos.top_concepts(settings.LANGUAGES_VOCID, lang=language)
+    def build():
+        r = breakers['topConcepts'].call(
+            skosmos.top_concepts, settings.LANGUAGES_VOCID, lang=language
+        )
 
         r = sorted(r, key=lambda k: k['label'].lower())
 
-        for lang in r:
-            languages.append(lang['uri'])
-            languages_labels.append(lang['label'])
-
-        if languages:
-            cache.set(cache_key_languages, languages, CACHE_TIME)
-        if languages_labels:
-            cache.set(cache_key_languages_labels, languages_labels, CACHE_TIME)
-
-    return languages, languages_labels
+        if not r:
+            return None, True
 
+        languages = [lang['uri'] for lang in r]
+        languages_labels = [lang['label'] for lang in r]
+        return (languages, languages_labels), True
 
-def get_materials():
-    return fetch_data('http://base.uni-ak.ac.at/portfolio/vocabulary/material_type')
+    return get_cached_vocabulary(f'get_languages_{language}', build, refresh) or (
+        [],
+        [],
+    )
 
 
-def get_media_licenses():
+def get_materials(refresh=False):
     return fetch_data(
-        'http://base.uni-ak.ac.at/portfolio/licenses/collection_media_licenses'
+        'http://base.uni-ak.ac.at/portfolio/vocabulary/material_type', refresh=refresh
     )
 
 
-def get_roles():
-    return fetch_data('http://base.uni-ak.ac.at/portfolio/vocabulary/role')
+def get_media_licenses(refresh=False):
+    return fetch_data(
+        'http://base.uni-ak.ac.at/portfolio/licenses/collection_media_licenses',
+        refresh=refresh,
+    )
 
 
-def get_statuses():
+def get_roles(refresh=False):
     return fetch_data(
-        'http://base.uni-ak.ac.at/vocabulary/collection_portfolio_project_status'
+        'http://base.uni-ak.ac.at/portfolio/vocabulary/role', refresh=refresh
     )
 
 
-def get_software_licenses():
+def get_statuses(refresh=False):
     return fetch_data(
-        'http://base.uni-ak.ac.at/portfolio/licenses/collection_software_licenses'
+        'http://base.uni-ak.ac.at/vocabulary/collection_portfolio_project_status',
+        refresh=refresh,
     )
 
 
-def get_text_types():
-    return fetch_data('http://base.uni-ak.ac.at/portfolio/vocabulary/text_type')
+def get_software_licenses(refresh=False):
+    return fetch_data(
+        'http://base.uni-ak.ac.at/portfolio/licenses/collection_software_licenses',
+        refresh=refresh,
+    )
 
 
-def get_entry_types():
-    cache_key = 'get_entry_types'
+def get_text_types(refresh=False):
+    return fetch_data(
+        'http://base.uni-ak.ac.at/portfolio/vocabulary/text_type', refresh=refresh
+    )
 
-    data = cache.get(cache_key, [])
 
-    if not data:
+def get_entry_types(refresh=False):
+    def build():
         from .schemas import ACTIVE_TYPES
 
-        data = list(
-            filter(
-                lambda x: x['source'] in ACTIVE_TYPES,
-                fetch_data(
-                    'http://base.uni-ak.ac.at/portfolio/taxonomy/portfolio_taxonomy'
-                ),
-            )
+        data, complete = _fetch_data(
+            'http://base.uni-ak.ac.at/portfolio/taxonomy/portfolio_taxonomy',
+            refresh=refresh,
         )
+        return list(filter(lambda x: x['source'] in ACTIVE_TYPES, data)), complete
 
-        if data:
-            cache.set(cache_key, data, CACHE_TIME)
-
-    return data
+    return get_cached_vocabulary('get_entry_types', build, refresh) or []
 
 
 def get_uri(concept, graph=settings.VOC_GRAPH):
@@ -260,21 +410,27 @@ def get_altlabel(concept, project=settings.VOC_ID, graph=settings.VOC_GRAPH, lan
         language = get_language() or 'en'
     cache_key = f'get_altlabel_{language}_{concept}'
 
-    label = cache.get(cache_key)
-    if not label:
-        try:
-            g = skosmos.data(f'{graph}{concept}')
-            for _uri, l in g.subject_objects(SKOS.altLabel):
-                if l.language == language:
-                    label = l
-                    break
-        except RequestException:
-            pass
+    label = mirror.get_altlabel(f'{graph}{concept}', language)
+    if label is not None:
+        return label or get_preflabel(concept, project, graph, language)
+
+    label = label_cache.get(cache_key)
+    if label is not None:
+        return label
+
+    try:
+        g = breakers['data'].call(skosmos.data, f'{graph}{concept}')
+        for _uri, l in g.subject_objects(SKOS.altLabel):
+            if l.language == language:
+                label = str(l)
+                break
+    except RequestException:
+        pass
 
     label = label or get_preflabel(concept, project, graph, language)
 
-    if label:
-        cache.set(cache_key, label, CACHE_TIME)
+    # missing labels are cached as well, but only for a short time
+    label_cache.set(cache_key, label, CACHE_TIME if label else NEGATIVE_CACHE_TIME)
 
     return label
 
@@ -292,32 +448,102 @@ def get_altlabel_collection(
     )
 
 
-def get_preflabel(
-    concept, project=settings.VOC_ID, graph=settings.VOC_GRAPH, lang=None
-):
-    if lang:
-        language = lang
-    else:
-        language = get_language() or 'en'
-    cache_key = f'get_preflabel_{project}_{language}_{concept}'
+def fetch_preflabel(concept, project, language):
+    """Fetch the prefLabel of a concept, falling back to the other language.
 
-    label = cache.get(cache_key)
-    if not label:
-        c = skosmos.get_concept(project, f'{graph}{concept}')
+    Returns None if the concept has no label or SKOSMOS could not be reached.
+    """
+    for lang in (language, 'de' if language == 'en' else 'en'):
         try:
-            label = c.label(language)
+            return skosmos_get(
+                'label',
+                f'{settings.SKOSMOS_API}{project}/label',
+                {'uri': concept, 'lang': lang},
+                timeout=LABEL_REQUEST_TIMEOUT,
+            )['prefLabel']
         except KeyError:
-            try:
-                label = c.label('de' if language == 'en' else 'en')
-            except KeyError:
-                pass
-        except RequestException:
             pass
+        except HTTPError as e:
+            if e.response is None or e.response.status_code >= 500:
+                return None
+        except RequestException:
+            return None
+
+
+def get_preflabels(concepts, langs=None, project=None):
+    """Return the prefLabels of several concepts in several languages.
+
+    Concepts are given as URIs, the result maps each URI to a dict of labels
+    per language. Labels are taken from the vocabulary mirror first, then from
+    the label cache with a single multi-get, and the remaining ones are
+    fetched concurrently from SKOSMOS and written back to the cache at once.
+    """
+    if not langs:
+        langs = [get_language() or 'en']
+
+    ret = {uri: {} for uri in concepts}
+    missing = {}
+
+    for uri in ret:
+        graph, concept = uri.rsplit('/', 1)
+        concept_project = project or PROJECT_MAPPING.get(f'{graph}/', settings.VOC_ID)
+        for language in langs:
+            label = mirror.get_preflabel(uri, language)
+            if label is None:
+                cache_key = f'get_preflabel_{concept_project}_{language}_{concept}'
+                missing[cache_key] = (uri, concept_project, language)
+            else:
+                ret[uri][language] = label
+
+    if missing:
+        cached = label_cache.get_many(missing.keys())
+        to_fetch = {}
+        for cache_key, (uri, concept_project, language) in missing.items():
+            if cache_key in cached:
+                ret[uri][language] = cached[cache_key]
+            else:
+                to_fetch[cache_key] = (uri, concept_project, language)
+
+        if to_fetch:
+            if len(to_fetch) == 1:
+                labels = [fetch_preflabel(*args) for args in to_fetch.values()]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(LABEL_FETCH_WORKERS, len(to_fetch))
+                ) as executor:
+                    labels = list(
+                        executor.map(
+                            lambda args: fetch_preflabel(*args), to_fetch.values()
+                        )
+                    )
+
+            fetched = {}
+            not_found = {}
+            for (cache_key, (uri, _project, language)), label in zip(
+                to_fetch.items(), labels
+            ):
+                ret[uri][language] = label or ''
+                if label:
+                    fetched[cache_key] = label
+                else:
+                    not_found[cache_key] = ''
 
-        if label:
-            cache.set(cache_key, label, CACHE_TIME)
+            if fetched:
+                label_cache.set_many(fetched, CACHE_TIME)
+            if not_found:
+                # cache missing labels for a short time, to not ask SKOSMOS on
+                # every call
+                label_cache.set_many(not_found, NEGATIVE_CACHE_TIME)
 
-    return label or ''
+    return ret
+
+
+def get_preflabel(
+    concept, project=settings.VOC_ID, graph=settings.VOC_GRAPH, lang=None
+):
+    language = lang or get_language() or 'en'
+    uri = f'{graph}{concept}'
+    return get_preflabels([uri], [language], project=project)[uri][language]
 
 
 def get_preflabel_via_uri(concept, lang=None):
@@ -327,18 +553,98 @@ def get_preflabel_via_uri(concept, lang=None):
 
 
 def get_collection_members(collection, maxhits=1000, use_cache=True):
-    cache_key = f'get_collection_members_{collection}'
+    members = mirror.get_collection_members(collection)
+    if members is not None:
+        return members
+
+    def build():
+        m = breakers['search'].call(
+            skosmos.search, query='*', group=collection, maxhits=maxhits, lang='en'
+        )
+
+        # remember the collection, so that it is refreshed in the background
+        collections = cache.get(COLLECTIONS_CACHE_KEY, {})
+        if collections.get(collection) != maxhits:
+            collections[collection] = maxhits
+            cache.set(COLLECTIONS_CACHE_KEY, collections, None)
+
+        return [i['uri'] for i in m], True
+
+    return (
+        get_cached_vocabulary(
+            f'get_collection_members_{collection}', build, refresh=not use_cache
+        )
+        or []
+    )
+
+
+def sync_vocabulary_mirror(source=None):
+    count = sync_mirror(mirror, PROJECT_MAPPING.values(), source=source)
+    # invalidate cached labels in all processes
+    label_cache.bump_version()
+    return count
+
 
-    members = cache.get(cache_key) if use_cache else None
-    if not members:
-        m = skosmos.search(query='*', group=collection, maxhits=maxhits, lang='en')
-        members = [i['uri'] for i in m]
+def schedule_vocabulary_refresh():
+    # only enqueue one refresh job at a time
+    if cache.add(VOCABULARY_REFRESH_SCHEDULED_KEY, True, VOCABULARY_REFRESH_LOCK_TIME):
+        queue = django_rq.get_queue('default')
+        queue.enqueue(
+            refresh_vocabularies,
+            job_timeout=VOCABULARY_REFRESH_LOCK_TIME,
+        )
+
+
+def refresh_vocabularies():
+    """Rebuild all cached vocabularies in all languages.
 
-        if members:
-            cache.set(cache_key, members, CACHE_TIME)
+    A lock makes sure that only one refresh runs at a time. Returns the number
+    of refreshed vocabularies or None if another refresh is already running.
+    """
+    cache.delete(VOCABULARY_REFRESH_SCHEDULED_KEY)
 
-    return members or []
+    if not cache.add(VOCABULARY_REFRESH_LOCK_KEY, True, VOCABULARY_REFRESH_LOCK_TIME):
+        logger.info('Vocabulary refresh is already running')
+        return None
 
+    count = 0
+    try:
+        for language, _name in settings.LANGUAGES:
+            with translation.override(language):
+                for getter in VOCABULARY_GETTERS:
+                    try:
+                        getter(refresh=True)
+                        count += 1
+                    except (KeyError, RequestException, ValueError):
+                        # keep serving the stale vocabulary
+                        logger.exception('Could not refresh %s', getter.__name__)
+
+        for collection, maxhits in cache.get(COLLECTIONS_CACHE_KEY, {}).items():
+            try:
+                get_collection_members(collection, maxhits=maxhits, use_cache=False)
+                count += 1
+            except (KeyError, RequestException, ValueError):
+                logger.exception('Could not refresh collection %s', collection)
+    finally:
+        cache.delete(VOCABULARY_REFRESH_LOCK_KEY)
+
+    return count
+
+
+VOCABULARY_GETTERS = [
+    get_base_keywords,
+    get_disciplines,
+    get_entry_types,
+    get_formats,
+    get_languages,
+    get_languages_choices,
+    get_materials,
+    get_media_licenses,
+    get_roles,
+    get_software_licenses,
+    get_statuses,
+    get_text_types,
+]
 
 get_altlabel_lazy = lazy(get_altlabel, str)
 get_preflabel_lazy = lazy(get_preflabel, str)
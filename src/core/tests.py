@@ -0,0 +1,183 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from .categories import (
+    DEFAULT_CATEGORY,
+    TAXONOMY,
+    VOCABULARY,
+    compile_rules,
+    get_category,
+)
+from .vocabulary import VocabularyIndex
+
+
+def concept(source, **labels):
+    return {'source': source, 'label': labels}
+
+
+class VocabularyIndexTestCase(SimpleTestCase):
+    data = [
+        concept('painting', en='Painting', de='Malerei'),
+        concept('oil_painting', en='Oil painting', de='Ölmalerei'),
+        concept('repainting', en='Repainting', de='Übermalung'),
+        concept('sculpture', en='Sculpture', de='Skulptur'),
+        concept('paint', en='Paint'),
+        concept('tv', en='TV', de='TV'),
+        concept('a', en='A', de='A'),
+    ]
+
+    def search(self, query, language='en', limit=None):
+        index = VocabularyIndex(self.data, language)
+        return [d['source'] for d in index.search(query, limit)]
+
+    def test_ranking(self):
+        # prefix matches first, then word matches, then infix matches, each in
+        # the order of the vocabulary
+        self.assertEqual(
+            self.search('paint'), ['painting', 'paint', 'oil_painting', 'repainting']
+        )
+        self.assertEqual(self.search('ing'), ['painting', 'oil_painting', 'repainting'])
+
+    def test_limit(self):
+        self.assertEqual(self.search('paint', limit=2), ['painting', 'paint'])
+        self.assertEqual(
+            self.search('', limit=3), ['painting', 'oil_painting', 'repainting']
+        )
+
+    def test_empty_query(self):
+        self.assertEqual(self.search(''), [d['source'] for d in self.data])
+
+    def test_short_labels(self):
+        self.assertEqual(self.search('tv'), ['tv'])
+        self.assertEqual(self.search('v'), ['tv'])
+        self.assertEqual(self.search('tvs'), [])
+        self.assertEqual(self.search('a')[0], 'a')
+        self.assertEqual(self.search('a tv'), [])
+
+    def test_case_and_accents(self):
+        self.assertEqual(
+            self.search('PAINTING'), ['painting', 'oil_painting', 'repainting']
+        )
+        self.assertEqual(self.search('olmal', language='de'), ['oil_painting'])
+        self.assertEqual(self.search('ölmal', language='de'), ['oil_painting'])
+
+    def test_language_fallback(self):
+        # concepts without a label in the requested language use the English one
+        self.assertEqual(self.search('paint', language='de'), ['paint'])
+        self.assertEqual(
+            self.search('malerei', language='de'), ['painting', 'oil_painting']
+        )
+        self.assertEqual(self.search('malerei', language='en'), [])
+
+
+COLLECTIONS = {
+    'collection_document_publication': ['anthology', 'monograph', 'journal'],
+    'collection_monograph': ['monograph'],
+    'collection_composite_volume': ['anthology'],
+    'collection_conference': ['course', 'workshop', 'symposium'],
+    'collection_teaching': ['course'],
+    'collection_education_qualification': ['workshop'],
+    'collection_event': ['board_meeting'],
+}
+
+
+def get_collection_members(collection):
+    name = collection[len(TAXONOMY) :]
+    return [f'{TAXONOMY}{t}' for t in COLLECTIONS.get(name, [])]
+
+
+def contributor(source, *role_names):
+    return {
+        'source': source,
+        'roles': [{'source': f'{VOCABULARY}{r}'} for r in role_names],
+    }
+
+
+class CategoryTestCase(SimpleTestCase):
+    owner = 'owner'
+
+    # (type, data, expected category)
+    cases = [
+        # role-gated rules
+        (
+            'recitation',
+            {'contributors': [contributor(owner, 'reading')]},
+            'public_appearance',
+        ),
+        (
+            'recitation',
+            {'contributors': [contributor(owner, 'author')]},
+            DEFAULT_CATEGORY,
+        ),
+        (
+            'recitation',
+            {'contributors': [contributor('other', 'reading')]},
+            DEFAULT_CATEGORY,
+        ),
+        ('recitation', {}, DEFAULT_CATEGORY),
+        # teaching vs. education qualifications
+        ('course', {'lecturers': [contributor(owner)]}, 'teaching'),
+        (
+            'course',
+            {'contributors': [contributor(owner, 'attendance')]},
+            'conferences_symposia',
+        ),
+        ('workshop', {'lecturers': [contributor(owner)]}, 'teaching'),
+        (
+            'workshop',
+            {'contributors': [contributor(owner, 'attendance')]},
+            'education_qualifications',
+        ),
+        ('workshop', {'lecturers': [contributor('other')]}, 'conferences_symposia'),
+        ('symposium', {'lecturers': [contributor(owner)]}, 'conferences_symposia'),
+        # series and journal editorship counts as composite volume for all documents
+        (
+            'journal',
+            {'contributors': [contributor(owner, 'series_and_journal_editorship')]},
+            'composite_volumes',
+        ),
+        (
+            'monograph',
+            {'contributors': [contributor(owner, 'series_and_journal_editorship')]},
+            'composite_volumes',
+        ),
+        ('monograph', {'authors': [contributor(owner)]}, 'monographs'),
+        ('anthology', {'editors': [contributor(owner)]}, 'composite_volumes'),
+        (
+            'anthology',
+            {'authors': [contributor(owner)]},
+            'general_documents_publications',
+        ),
+        ('journal', {}, 'general_documents_publications'),
+        # events
+        (
+            'board_meeting',
+            {'contributors': [contributor(owner, 'jury')]},
+            'memberships',
+        ),
+        (
+            'board_meeting',
+            {'contributors': [contributor(owner, 'committee_work')]},
+            'expert_functions',
+        ),
+        ('board_meeting', {}, 'general_functions_practice'),
+        # default category
+        ('unknown', {'authors': [contributor(owner)]}, DEFAULT_CATEGORY),
+        (None, {}, DEFAULT_CATEGORY),
+    ]
+
+    def setUp(self):
+        with mock.patch(
+            'core.categories.get_collection_members', get_collection_members
+        ):
+            rules = compile_rules()
+        patcher = mock.patch('core.categories.get_rules', return_value=rules)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_categories(self):
+        for entry_type, data, expected in self.cases:
+            source = f'{TAXONOMY}{entry_type}' if entry_type else None
+            with self.subTest(type=entry_type, data=data):
+                self.assertEqual(get_category(source, data, self.owner), expected)
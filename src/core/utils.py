@@ -1,3 +1,6 @@
+import json
+import os
+import tempfile
 import unicodedata
 
 from django.utils.functional import lazy
@@ -10,3 +13,20 @@ def unaccent(text):
     return str(
         unicodedata.normalize('NFD', text).encode('ascii', 'ignore').decode('utf-8')
     )
+
+
+def write_json_atomic(path, data):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    # write to a temporary file first, so that readers never see a partially
+    # written file
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
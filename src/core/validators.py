@@ -1,26 +1,21 @@
 import json
 
-from jsonschema import (
-    Draft4Validator,
-    FormatChecker,
-    ValidationError as SchemaValidationError,
-    validate,
-)
+from jsonschema import ValidationError as SchemaValidationError
 
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 
-from .schemas import get_keywords_jsonschema, get_texts_jsonschema, get_type_jsonschema
+from .schemas import (
+    get_keywords_validator,
+    get_texts_validator,
+    get_type_validator,
+    run_validator,
+)
 
 
 def validate_type(value):
     try:
-        validate(
-            value,
-            get_type_jsonschema(),
-            cls=Draft4Validator,
-            format_checker=FormatChecker(),
-        )
+        run_validator(get_type_validator(), value)
     except SchemaValidationError as e:
         msg = _('Invalid type: %(error)s') % {'error': e.message}  # noqa: B306
         raise ValidationError(msg) from e
@@ -28,12 +23,7 @@ def validate_type(value):
 
 def validate_keywords(value):
     try:
-        validate(
-            value,
-            get_keywords_jsonschema(),
-            cls=Draft4Validator,
-            format_checker=FormatChecker(),
-        )
+        run_validator(get_keywords_validator(), value)
         if len(value) > len({json.dumps(d, sort_keys=True) for d in value}):
             raise ValidationError(_('Keywords contains duplicate entries'))
     except SchemaValidationError as e:
@@ -43,12 +33,7 @@ def validate_keywords(value):
 
 def validate_texts(value):
     try:
-        validate(
-            value,
-            get_texts_jsonschema(),
-            cls=Draft4Validator,
-            format_checker=FormatChecker(),
-        )
+        run_validator(get_texts_validator(), value)
         for i in value:
             data = i.get('data')
             if data:
@@ -0,0 +1,275 @@
+import json
+import logging
+import os
+import threading
+import time
+
+import requests
+from rdflib import Graph
+from rdflib.namespace import RDF, SKOS
+
+from django.conf import settings
+from django.utils import timezone
+
+from .utils import unaccent, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+MIRROR_FORMAT_VERSION = 1
+MIRROR_CHECK_INTERVAL = 60  # seconds between checks for an updated mirror file
+INDEX_NGRAM_SIZE = 3
+
+
+class VocabularyMirror:
+    """Local, read-only copy of all concepts of the SKOSMOS vocabularies.
+
+    The mirror is stored as a JSON file which maps every concept URI to its
+    project, its prefLabels and altLabels per language and the collections it
+    is a member of. Each process loads the file into memory and reloads it as
+    soon as a newer version has been written by :func:`sync_mirror`.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._concepts = {}
+        self._members = {}
+        self._mtime = None
+        self._checked = None
+
+    def _load(self):
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            self._concepts, self._members, self._mtime = {}, {}, None
+            return
+
+        if mtime == self._mtime:
+            return
+
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            logger.exception('Could not load vocabulary mirror %s', self.path)
+            return
+
+        if data.get('version') != MIRROR_FORMAT_VERSION:
+            logger.warning(
+                'Ignoring vocabulary mirror %s with unsupported version %s',
+                self.path,
+                data.get('version'),
+            )
+            return
+
+        concepts = data.get('concepts', {})
+        members = {}
+        for uri, concept in concepts.items():
+            for collection in concept.get('collections', []):
+                members.setdefault(collection, []).append(uri)
+
+        self._concepts, self._members, self._mtime = concepts, members, mtime
+
+    def _ensure_loaded(self):
+        now = time.monotonic()
+        if self._checked is None or now - self._checked > MIRROR_CHECK_INTERVAL:
+            with self._lock:
+                if self._checked is None or now - self._checked > MIRROR_CHECK_INTERVAL:
+                    self._load()
+                    self._checked = now
+
+    def reload(self):
+        with self._lock:
+            self._mtime = None
+            self._load()
+            self._checked = time.monotonic()
+
+    @property
+    def available(self):
+        self._ensure_loaded()
+        return bool(self._concepts)
+
+    def get_concept(self, uri):
+        self._ensure_loaded()
+        return self._concepts.get(uri)
+
+    def get_preflabel(self, uri, lang):
+        """Return the prefLabel of a concept in the requested language.
+
+        Falls back to the other language if no label exists in the requested
+        one. Returns None if the concept is not part of the mirror.
+        """
+        concept = self.get_concept(uri)
+        if concept is None:
+            return None
+        labels = concept.get('prefLabel', {})
+        return labels.get(lang) or labels.get('de' if lang == 'en' else 'en') or ''
+
+    def get_altlabel(self, uri, lang):
+        """Return the altLabel of a concept in the requested language.
+
+        Returns an empty string if the concept has no altLabel in this
+        language and None if the concept is not part of the mirror.
+        """
+        concept = self.get_concept(uri)
+        if concept is None:
+            return None
+        return concept.get('altLabel', {}).get(lang) or ''
+
+    def get_collection_members(self, collection):
+        """Return the URIs of all concepts belonging to a collection.
+
+        Returns None if the collection is not part of the mirror.
+        """
+        self._ensure_loaded()
+        if collection not in self._concepts:
+            return None
+        return list(self._members.get(collection, []))
+
+    def write(self, concepts):
+        data = {
+            'version': MIRROR_FORMAT_VERSION,
+            'created': timezone.now().isoformat(),
+            'concepts': concepts,
+        }
+        write_json_atomic(self.path, data)
+        self.reload()
+
+
+def normalize_label(label):
+    return unaccent(label.lower())
+
+
+class VocabularyIndex:
+    """Search index over the labels of a vocabulary in one language.
+
+    Labels are normalized once and every n-gram of a label up to
+    INDEX_NGRAM_SIZE characters is mapped to the positions of the concepts
+    containing it. Short queries are answered directly from the n-grams,
+    longer ones by verifying the concepts of their rarest n-gram.
+    """
+
+    def __init__(self, data, language):
+        self.data = data
+        self.labels = []
+        self.ngrams = {}
+
+        for pos, d in enumerate(data):
+            label = normalize_label(d['label'].get(language, d['label'].get('en', '')))
+            self.labels.append(label)
+            ngrams = {
+                label[i : i + n]
+                for n in range(1, INDEX_NGRAM_SIZE + 1)
+                for i in range(len(label) - n + 1)
+            }
+            for ngram in ngrams:
+                self.ngrams.setdefault(ngram, []).append(pos)
+
+    def _rank(self, pos, query):
+        label = self.labels[pos]
+        if label.startswith(query):
+            return 0
+        i = label.find(query)
+        while i > 0:
+            # query matches the start of a word
+            if not label[i - 1].isalnum():
+                return 1
+            i = label.find(query, i + 1)
+        return 2
+
+    def search(self, query, limit=None):
+        """Return all concepts whose label contains the query.
+
+        Concepts whose label starts with the query come first, followed by
+        those with a word starting with the query and all other matches.
+        Within each group the order of the vocabulary is kept.
+        """
+        query = normalize_label(query)
+
+        if not query:
+            return self.data[:limit]
+
+        if len(query) <= INDEX_NGRAM_SIZE:
+            candidates = self.ngrams.get(query, [])
+        else:
+            postings = [
+                self.ngrams.get(query[i : i + INDEX_NGRAM_SIZE], [])
+                for i in range(len(query) - INDEX_NGRAM_SIZE + 1)
+            ]
+            candidates = [p for p in min(postings, key=len) if query in self.labels[p]]
+
+        ranked = sorted(candidates, key=lambda p: (self._rank(p, query), p))
+        return [self.data[p] for p in ranked[:limit]]
+
+
+def fetch_vocabulary_graph(vocid):
+    req = requests.get(
+        f'{settings.SKOSMOS_API}{vocid}/data',
+        params={'format': 'text/turtle'},
+        timeout=settings.REQUESTS_TIMEOUT,
+    )
+    req.raise_for_status()
+
+    g = Graph()
+    g.parse(data=req.text, format='turtle')
+    return g
+
+
+def concepts_from_graph(g, vocid):
+    concepts = {}
+
+    for subject in set(g.subjects(SKOS.prefLabel, None)):
+        concept = {'project': vocid, 'prefLabel': {}, 'altLabel': {}}
+        for label in g.objects(subject, SKOS.prefLabel):
+            if label.language:
+                concept['prefLabel'][label.language] = str(label)
+        for label in g.objects(subject, SKOS.altLabel):
+            # keep the first altLabel per language, as SKOSMOS does
+            if label.language and label.language not in concept['altLabel']:
+                concept['altLabel'][label.language] = str(label)
+        concepts[str(subject)] = concept
+
+    # collections might be nested, so a concept belongs to every collection
+    # which is reachable via skos:member
+    parents = {}
+    for collection, member in g.subject_objects(SKOS.member):
+        parents.setdefault(str(member), set()).add(str(collection))
+
+    for subject in set(g.subjects(RDF.type, SKOS.Concept)):
+        uri = str(subject)
+        if uri not in concepts:
+            continue
+        collections = set()
+        stack = list(parents.get(uri, ()))
+        while stack:
+            collection = stack.pop()
+            if collection not in collections:
+                collections.add(collection)
+                stack.extend(parents.get(collection, ()))
+        concepts[uri]['collections'] = sorted(collections)
+
+    return concepts
+
+
+def sync_mirror(mirror, projects, source=None):
+    """Fill the mirror with all concepts of the given SKOSMOS projects.
+
+    If a source file is given, it is used instead of SKOSMOS. It has to be in
+    the same format as the mirror itself, which allows to use a local JSON
+    fixture as a stand-in for SKOSMOS.
+    """
+    if source:
+        with open(source) as f:
+            data = json.load(f)
+        concepts = data['concepts']
+    else:
+        concepts = {}
+        for vocid in projects:
+            concepts.update(concepts_from_graph(fetch_vocabulary_graph(vocid), vocid))
+
+    if not concepts:
+        raise ValueError('No concepts found, not updating vocabulary mirror')
+
+    mirror.write(concepts)
+
+    return len(concepts)
@@ -5,5 +5,11 @@ class GeneralConfig(AppConfig):
     name = 'general'
 
     def ready(self):
+        from django.db.models import CharField, TextField
+
         # import signal handlers
         from . import signals  # noqa: F401
+        from .postgres import TrigramWordSimilar
+
+        CharField.register_lookup(TrigramWordSimilar)
+        TextField.register_lookup(TrigramWordSimilar)
@@ -0,0 +1,284 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import cache
+
+
+class LocalCache:
+    """Thread-safe in-process LRU cache with a TTL and a maximum size."""
+
+    def __init__(self, maxsize=10000, timeout=300):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                value, expires = item
+                if expires > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, timeout=None):
+        expires = time.monotonic() + (self.timeout if timeout is None else timeout)
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class TwoTierCache:
+    """Per-process LRU cache in front of the shared (Redis) cache.
+
+    Values are looked up in the local cache first and only on a miss in the
+    shared cache. A version stamp stored in the shared cache is part of every
+    shared key and is checked at most every ``version_check_interval`` seconds,
+    so bumping it invalidates both tiers in all processes.
+    """
+
+    def __init__(
+        self,
+        prefix,
+        maxsize=10000,
+        local_timeout=300,
+        version_check_interval=30,
+    ):
+        self.prefix = prefix
+        self.version_key = f'{prefix}__version'
+        self.version_check_interval = version_check_interval
+        self.local = LocalCache(maxsize=maxsize, timeout=local_timeout)
+        self.shared_hits = 0
+        self.shared_misses = 0
+        self._version = None
+        self._version_checked = None
+
+    def _check_version(self):
+        now = time.monotonic()
+        if (
+            self._version_checked is None
+            or now - self._version_checked > self.version_check_interval
+        ):
+            cache.add(self.version_key, 1, None)
+            version = cache.get(self.version_key, 1)
+            if version != self._version:
+                self.local.clear()
+                self._version = version
+            self._version_checked = now
+        return self._version
+
+    @property
+    def version(self):
+        return self._check_version()
+
+    def _shared_key(self, key):
+        return f'{self.prefix}__{self._check_version()}__{key}'
+
+    def get(self, key, default=None):
+        shared_key = self._shared_key(key)
+        value = self.local.get(key)
+        if value is None:
+            value = cache.get(shared_key)
+            if value is None:
+                self.shared_misses += 1
+                return default
+            self.shared_hits += 1
+            self.local.set(key, value)
+        return value
+
+    def get_many(self, keys):
+        ret = {}
+        missing = {}
+        for key in keys:
+            value = self.local.get(key)
+            if value is None:
+                missing[self._shared_key(key)] = key
+            else:
+                ret[key] = value
+        if missing:
+            # fetch all missing keys with one round trip
+            values = cache.get_many(list(missing))
+            for shared_key, value in values.items():
+                ret[missing[shared_key]] = value
+                self.local.set(missing[shared_key], value)
+            self.shared_hits += len(values)
+            self.shared_misses += len(missing) - len(values)
+        return ret
+
+    def _local_timeout(self, timeout):
+        # values must not outlive their shared timeout in the local cache
+        if timeout is None:
+            return None
+        return min(timeout, self.local.timeout)
+
+    def set(self, key, value, timeout=None):
+        cache.set(self._shared_key(key), value, timeout)
+        self.local.set(key, value, self._local_timeout(timeout))
+
+    def set_many(self, data, timeout=None):
+        cache.set_many({self._shared_key(k): v for k, v in data.items()}, timeout)
+        for key, value in data.items():
+            self.local.set(key, value, self._local_timeout(timeout))
+
+    def bump_version(self):
+        try:
+            cache.incr(self.version_key)
+        except ValueError:
+            cache.set(self.version_key, 2, None)
+        self.local.clear()
+        self._version_checked = None
+
+    def stats(self):
+        return {
+            'local_hits': self.local.hits,
+            'local_misses': self.local.misses,
+            'local_size': len(self.local),
+            'shared_hits': self.shared_hits,
+            'shared_misses': self.shared_misses,
+            'version': self._version,
+        }
+
+
+class StaleCache:
+    """Shared cache with a soft and a hard timeout per value.
+
+    Values are kept in the shared cache until the hard timeout. Once the soft
+    timeout has passed, they are still returned but flagged as stale, so that
+    callers can serve them while they are refreshed in the background.
+    """
+
+    def __init__(self, prefix, soft_timeout, hard_timeout):
+        self.prefix = prefix
+        self.soft_timeout = soft_timeout
+        self.hard_timeout = hard_timeout
+
+    def _key(self, key):
+        return f'{self.prefix}__{key}'
+
+    def get(self, key):
+        """Return a tuple of the cached value (or None) and its staleness."""
+        item = cache.get(self._key(key))
+        if item is None:
+            return None, False
+        value, soft_expires = item
+        return value, soft_expires <= time.time()
+
+    def set(self, key, value, soft_timeout=None):
+        soft_expires = time.time() + (
+            self.soft_timeout if soft_timeout is None else soft_timeout
+        )
+        cache.set(self._key(key), (value, soft_expires), self.hard_timeout)
+
+    def delete(self, key):
+        cache.delete(self._key(key))
+
+
+class GenerationCache:
+    """Shared cache of values, which depend on a set of generation counters.
+
+    Every value is stored together with the current generations of the
+    counters it depends on, e.g. one per user. Bumping a counter invalidates
+    all values depending on it, without having to know their keys. Values and
+    generations are fetched with a single round trip.
+
+    Counters start at the current time in microseconds, so that a counter
+    which got lost never repeats an earlier generation, and the generations
+    can also be used as content versions, e.g. for ETags.
+    """
+
+    def __init__(self, prefix, timeout):
+        self.prefix = prefix
+        self.timeout = timeout
+
+    def _key(self, key):
+        return f'{self.prefix}__{key}'
+
+    def _generation_key(self, name):
+        return f'{self.prefix}__generation__{name}'
+
+    def _get_generations(self, generation_keys, values):
+        missing = [k for k in generation_keys if k not in values]
+        if missing:
+            initial = time.time_ns() // 1000
+            for k in missing:
+                cache.add(k, initial, None)
+            values.update(cache.get_many(missing))
+        return values
+
+    def get_generations(self, names):
+        """Return the current generations of the given counters."""
+        generation_keys = [self._generation_key(name) for name in names]
+        values = self._get_generations(generation_keys, cache.get_many(generation_keys))
+        return tuple(values.get(k) for k in generation_keys)
+
+    def get(self, key, generations):
+        """Return a tuple of the cached value (or None) and the generations.
+
+        The generations have to be passed to set() when the value is stored.
+        """
+        return self.get_many({key: generations})[key]
+
+    def get_many(self, items):
+        """Return the cached values and generations of multiple keys.
+
+        ``items`` maps each key to the names of the generations it depends on.
+        """
+        generation_keys = {
+            name: self._generation_key(name)
+            for generations in items.values()
+            for name in generations
+        }
+        values = self._get_generations(
+            generation_keys.values(),
+            cache.get_many([*(self._key(k) for k in items), *generation_keys.values()]),
+        )
+
+        ret = {}
+        for key, generations in items.items():
+            current = tuple(values.get(generation_keys[g]) for g in generations)
+            value = None
+            item = values.get(self._key(key))
+            if item is not None and item[0] == current:
+                value = item[1]
+            ret[key] = (value, current)
+        return ret
+
+    def set(self, key, value, generations):
+        cache.set(self._key(key), (generations, value), self.timeout)
+
+    def set_many(self, items):
+        """Store multiple values, given as tuples of value and generations."""
+        cache.set_many(
+            {self._key(k): (g, v) for k, (v, g) in items.items()}, self.timeout
+        )
+
+    def bump(self, *names):
+        for name in names:
+            key = self._generation_key(name)
+            if not cache.add(key, time.time_ns() // 1000, None):
+                try:
+                    cache.incr(key)
+                except ValueError:
+                    # evicted in the meantime
+                    cache.add(key, time.time_ns() // 1000, None)
@@ -0,0 +1,78 @@
+import logging
+import threading
+import time
+
+from requests import HTTPError, RequestException
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(RequestException):
+    """Raised instead of calling a service whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Per-process circuit breaker for requests to an external service.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and all
+    calls fail immediately with :class:`CircuitOpenError` for ``reset_timeout``
+    seconds. Afterwards a single trial call is let through, which either
+    closes the circuit again or keeps it open for another period. Client
+    errors (4xx) are regarded as successful calls, since the service answered.
+    """
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        return self.opened_at is not None
+
+    def _allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                # let one trial call through and block others until it is done
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def _success(self):
+        with self._lock:
+            if self.opened_at is not None:
+                logger.info('Circuit %s closed', self.name)
+            self.failures = 0
+            self.opened_at = None
+
+    def _failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    logger.warning(
+                        'Circuit %s opened after %s failures', self.name, self.failures
+                    )
+                self.opened_at = time.monotonic()
+
+    def call(self, func, *args, **kwargs):
+        if not self._allow():
+            raise CircuitOpenError(f'Circuit {self.name} is open')
+        try:
+            result = func(*args, **kwargs)
+        except HTTPError as e:
+            if e.response is not None and e.response.status_code < 500:
+                self._success()
+            else:
+                self._failure()
+            raise
+        except RequestException:
+            self._failure()
+            raise
+        self._success()
+        return result
@@ -0,0 +1,128 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+
+from rest_framework import exceptions
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+from django.db.models import F, Q
+from django.utils.translation import gettext_lazy as _
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination on the current sort field and the primary key.
+
+    The view has to define ``keyset_expressions``, mapping each allowed sort
+    field to the expression used for ordering, and ``keyset_default_ordering``.
+    Instead of an offset, the cursor contains the sort value and primary key of
+    the last entry of the previous page, so fetching a page needs neither an
+    offset nor a count, and can be answered by an index on the sort expression
+    and the primary key.
+    """
+
+    cursor_query_param = 'cursor'
+    limit_query_param = 'limit'
+    default_limit = 10
+    max_limit = 100
+    invalid_cursor_message = _('Invalid cursor')
+
+    def get_limit(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.limit_query_param],
+                strict=True,
+                cutoff=self.max_limit,
+            )
+        except (KeyError, ValueError):
+            return self.default_limit
+
+    def get_ordering(self, request, view):
+        ordering = request.query_params.get(
+            api_settings.ORDERING_PARAM, view.keyset_default_ordering
+        )
+        field = ordering.lstrip('-')
+        if field not in view.keyset_expressions:
+            ordering = view.keyset_default_ordering
+            field = ordering.lstrip('-')
+        return ordering, field, ordering.startswith('-')
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            cursor = json.loads(urlsafe_b64decode(encoded.encode('ascii')))
+            return cursor['sort'], cursor['value'], cursor['pk']
+        except (TypeError, ValueError, KeyError) as e:
+            raise exceptions.NotFound(self.invalid_cursor_message) from e
+
+    def encode_cursor(self, value, pk):
+        if isinstance(value, datetime):
+            # keep microseconds, which are cut off by the DRF JSONEncoder
+            value = value.isoformat()
+        cursor = {'sort': self.ordering, 'value': value, 'pk': pk}
+        encoded = urlsafe_b64encode(json.dumps(cursor).encode())
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            encoded.decode('ascii'),
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.ordering, field, descending = self.get_ordering(request, view)
+
+        queryset = queryset.annotate(keyset_value=view.keyset_expressions[field])
+        if descending:
+            queryset = queryset.order_by(F('keyset_value').desc(), '-pk')
+        else:
+            queryset = queryset.order_by(F('keyset_value').asc(), 'pk')
+
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            sort, value, pk = cursor
+            if sort != self.ordering:
+                raise exceptions.NotFound(self.invalid_cursor_message)
+            lookup = 'lt' if descending else 'gt'
+            queryset = queryset.filter(
+                Q(**{f'keyset_value__{lookup}': value})
+                | Q(keyset_value=value, **{f'pk__{lookup}': pk})
+            )
+
+        # fetch one more item to know whether there is a next page
+        results = list(queryset[: self.limit + 1])
+        self.next_cursor = None
+        if len(results) > self.limit:
+            results = results[: self.limit]
+            self.next_cursor = (results[-1].keyset_value, results[-1].pk)
+
+        return results
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        return self.encode_cursor(*self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                'next': self.get_next_link(),
+                'results': data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {
+                    'type': 'string',
+                    'nullable': True,
+                },
+                'results': schema,
+            },
+        }
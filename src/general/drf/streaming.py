@@ -0,0 +1,38 @@
+import json
+
+from rest_framework.utils.encoders import JSONEncoder
+
+from django.http import StreamingHttpResponse
+
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+
+
+def iter_json_array(items):
+    """Encode items as a JSON array, one element at a time."""
+    yield '['
+    for i, item in enumerate(items):
+        yield (',' if i else '') + json.dumps(item, cls=JSONEncoder)
+    yield ']'
+
+
+def iter_ndjson(items):
+    """Encode items as newline delimited JSON."""
+    for item in items:
+        yield json.dumps(item, cls=JSONEncoder) + '\n'
+
+
+def streaming_json_response(queryset, ndjson=False, chunk_size=500):
+    """Return a response streaming the results of a queryset as JSON.
+
+    The queryset is iterated with a server-side cursor in chunks of
+    ``chunk_size`` rows, so memory usage does not depend on the number of
+    results.
+    """
+    items = queryset.iterator(chunk_size=chunk_size)
+    if ndjson:
+        return StreamingHttpResponse(
+            iter_ndjson(items), content_type=NDJSON_CONTENT_TYPE
+        )
+    return StreamingHttpResponse(
+        iter_json_array(items), content_type='application/json'
+    )
@@ -1,6 +1,7 @@
 from django.contrib.postgres.search import SearchVector
 from django.db.models import FloatField, Func, JSONField, Value
 from django.db.models.functions import Cast, Coalesce
+from django.db.models.lookups import PostgresOperatorLookup
 
 
 class SearchVectorJSON(SearchVector):
@@ -26,3 +27,8 @@ class TrigramWordBase(Func):
 
 class TrigramWordSimilarity(TrigramWordBase):
     function = 'WORD_SIMILARITY'
+
+
+class TrigramWordSimilar(PostgresOperatorLookup):
+    lookup_name = 'trigram_word_similar'
+    postgres_operator = '%%>'
@@ -9,6 +9,21 @@ max_requests_jitter = 50
 timeout = 300
 workers = os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1)
 worker_tmp_dir = '/dev/shm'  # nosec
+# load the application (incl. the schema registry) once in the master process,
+# so that workers share it. Off by default, since a graceful restart (HUP) only
+# re-forks the workers from the master and would keep serving the old code, so
+# gunicorn has to be fully restarted after updates if enabled.
+preload_app = os.getenv('GUNICORN_PRELOAD_APP', 'false').lower() in ('true', '1')
+
+
+def pre_fork(server, worker):
+    # database connections opened while loading the app must not be shared
+    # with the workers, redis-py resets its connection pools after forking
+    if preload_app:
+        from django.db import connections
+
+        connections.close_all()
+
 
 loglevel = 'info'
 accesslog = '/logs/gunicorn.access.log'
@@ -18,3 +18,13 @@ class MediaServerConfig(AppConfig):
                 id=job_id,
                 timeout=7200,
             )
+
+        job_id = '9d2e7b41-6a3f-4c8e-b0d9-e5a1f7c34b62'
+
+        if job_id not in scheduler:
+            scheduler.cron(
+                '35 3 * * *',
+                'media_server.models.reconcile_all_storage_usage',
+                id=job_id,
+                timeout=7200,
+            )
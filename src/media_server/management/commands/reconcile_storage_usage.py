@@ -0,0 +1,32 @@
+from progressbar import progressbar
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from media_server.models import reconcile_storage_usage
+
+
+class Command(BaseCommand):
+    help = 'Reconcile the storage usage ledger with the file system'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'username',
+            nargs='*',
+            help='Only reconcile the storage usage of the given users',
+        )
+
+    def handle(self, *args, **options):
+        users = get_user_model().objects.all()
+        if options['username']:
+            users = users.filter(username__in=options['username'])
+            missing = set(options['username']) - set(
+                users.values_list('username', flat=True)
+            )
+            if missing:
+                raise CommandError(f'Users do not exist: {", ".join(sorted(missing))}')
+
+        for user in progressbar(users.iterator(), max_value=users.count()):
+            reconcile_storage_usage(user)
+
+        self.stdout.write(self.style.SUCCESS('Successfully reconciled storage usage'))
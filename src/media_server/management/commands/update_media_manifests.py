@@ -0,0 +1,28 @@
+from progressbar import progressbar
+
+from django.core.management.base import BaseCommand
+
+from media_server.models import STATUS_CONVERTED, Media
+
+
+class Command(BaseCommand):
+    help = 'Write the derivative manifests of converted media'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Update all manifests, not only missing ones',
+        )
+
+    def handle(self, *args, **options):
+        media = Media.objects.filter(status=STATUS_CONVERTED)
+        if not options['all']:
+            media = media.filter(manifest={})
+
+        for m in progressbar(media.iterator(), max_value=media.count()):
+            m.update_manifest()
+            # don't touch the modification date, the media itself didn't change
+            Media.objects.filter(pk=m.pk).update(manifest=m.manifest)
+
+        self.stdout.write(self.style.SUCCESS('Successfully updated media manifests'))
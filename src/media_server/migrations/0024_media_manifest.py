@@ -0,0 +1,18 @@
+# Generated by Django 3.2.20 on 2026-10-18 16:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('media_server', '0023_auto_20230822_1854'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='media',
+            name='manifest',
+            field=models.JSONField(default=dict, editable=False),
+        ),
+    ]
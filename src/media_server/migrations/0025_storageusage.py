@@ -0,0 +1,32 @@
+# Generated by Django 3.2.20 on 2026-10-18 17:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('media_server', '0024_media_manifest'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StorageUsage',
+            fields=[
+                (
+                    'user',
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name='storage_usage',
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ('size', models.BigIntegerField(default=0)),
+                ('reconciled', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
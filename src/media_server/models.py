@@ -11,19 +11,21 @@ from rq.exceptions import InvalidJobOperation, NoSuchJobError
 from rq.job import Job
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.db import models, transaction
-from django.db.models import JSONField
-from django.db.models.signals import post_delete, post_save, pre_delete
+from django.db.models import F, JSONField, Q
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 
-from core.models import Entry
+from core.models import Entry, invalidate_user_data
 from general.models import ShortUUIDField
 
 from . import signals
 from .apps import MediaServerConfig
 from .clamav import validate_file_infection
 from .storages import ProtectedFileSystemStorage
-from .utils import humanize_size, user_hash
+from .utils import get_directory_size, get_user_storage_path, humanize_size, user_hash
 from .validators import validate_license
 
 SCRIPTS_BASE_DIR = os.path.join(settings.BASE_DIR, MediaServerConfig.name, 'scripts')
@@ -134,6 +136,8 @@ class Media(models.Model):
     license = JSONField(validators=[validate_license])
     featured = models.BooleanField(default=False)
     order = models.PositiveIntegerField(default=2147483647)
+    # derivatives created by the conversion, see update_manifest()
+    manifest = JSONField(default=dict, editable=False)
 
     class Meta:
         indexes = [
@@ -159,6 +163,7 @@ class Media(models.Model):
         return ret
 
     def convert(self, command):
+        assets_size = get_directory_size(self.get_protected_assets_path())
         try:
             if self.status == STATUS_NOT_CONVERTED:
                 self.status = STATUS_IN_PROGRESS
@@ -167,6 +172,7 @@ class Media(models.Model):
                 process = subprocess.run(command, stderr=subprocess.PIPE)  # nosec
 
                 if process.returncode == 0:
+                    self.update_manifest()
                     self.status = STATUS_CONVERTED
                     self.save()
                 else:
@@ -184,6 +190,12 @@ class Media(models.Model):
             )
             self.status = STATUS_ERROR
             self.save()
+        finally:
+            # also failed conversions might leave derivatives behind
+            update_storage_usage(
+                self.owner,
+                get_directory_size(self.get_protected_assets_path()) - assets_size,
+            )
 
     def get_protected_assets_path(self):
         return os.path.join(os.path.dirname(self.file.path), self.id)
@@ -201,7 +213,10 @@ class Media(models.Model):
 
     def get_previews(self):
         ret = []
-        if self.check_file('preview.txt'):
+        if 'files' in self.manifest:
+            for p in self.manifest['previews']:
+                ret.append({f'{p["width"]}w': self.get_url(p['file'])})
+        elif self.check_file('preview.txt'):
             with open(self.get_file_path('preview.txt')) as f:
                 for line in f:
                     k, v = line.rstrip('\n').split(',')
@@ -250,9 +265,43 @@ class Media(models.Model):
         return os.path.join(self.get_protected_assets_path(), filename)
 
     def check_file(self, filename):
+        if 'files' in self.manifest:
+            return filename in self.manifest['files']
+        # media converted before manifests were introduced
         path = self.get_file_path(filename)
         return os.path.isfile(path)
 
+    def update_manifest(self):
+        """Record the derivatives created by the conversion.
+
+        The manifest contains the names and sizes of all derivatives, the
+        widths of the previews and the duration of audio and video files, so
+        that their URLs can be built without accessing the file system.
+        """
+        files = {}
+        try:
+            with os.scandir(self.get_protected_assets_path()) as it:
+                for f in it:
+                    if f.is_file():
+                        files[f.name] = {'size': f.stat().st_size}
+        except FileNotFoundError:
+            pass
+
+        previews = []
+        if 'preview.txt' in files:
+            with open(self.get_file_path('preview.txt')) as f:
+                for line in f:
+                    k, v = line.rstrip('\n').split(',')
+                    previews.append({'width': int(k), 'file': v})
+
+        manifest = {'files': files, 'previews': previews}
+
+        duration = self.exif.get('Duration')
+        if isinstance(duration, dict) and duration.get('num') is not None:
+            manifest['duration'] = duration['num']
+
+        self.manifest = manifest
+
     def get_url(self, filename):
         if isinstance(filename, str):
             filename = [filename]
@@ -344,6 +393,25 @@ class Media(models.Model):
         return f'job_media_info_and_convert_{self.pk}'
 
 
+class StorageUsage(models.Model):
+    """Ledger of the storage used by the media files of a user.
+
+    The size is updated whenever originals or derivatives are written or
+    deleted, so that the quota can be checked without walking the user's
+    directory. Drift, e.g. from interrupted conversions, is fixed by
+    reconcile_all_storage_usage(), which runs every night.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='storage_usage',
+    )
+    size = models.BigIntegerField(default=0)
+    reconciled = models.DateTimeField(null=True, blank=True)
+
+
 MIME_TYPE_TO_TYPE = {
     **{k: AUDIO_TYPE for k in AUDIO_MIME_TYPES},
     **{k: DOCUMENT_TYPE for k in DOCUMENT_MIME_TYPES},
@@ -356,6 +424,14 @@ def has_entry_media(entry_id):
     return Media.objects.filter(entry_id=entry_id).exists()
 
 
+def get_entries_with_media(entry_ids):
+    return set(
+        Media.objects.filter(entry_id__in=entry_ids)
+        .values_list('entry_id', flat=True)
+        .distinct()
+    )
+
+
 def get_media_for_entry(entry_id, flat: bool = True, published: bool = None):
     if flat:
         return Media.objects.filter(entry_id=entry_id).values_list('pk', flat=True)
@@ -383,8 +459,25 @@ def get_image_for_entry(entry_id):
     for m in Media.objects.filter(entry_id=entry_id, status=STATUS_CONVERTED).order_by(
         '-featured', 'order', 'created'
     ):
-        if m.get_image():
-            return m.get_image()
+        image = m.get_image()
+        if image:
+            return image
+
+
+def get_images_for_entries(entry_ids):
+    """Return the cover images of several entries with a single query.
+
+    Entries without an image are not part of the returned dict.
+    """
+    ret = {}
+    for m in Media.objects.filter(
+        entry_id__in=entry_ids, status=STATUS_CONVERTED
+    ).order_by('-featured', 'order', 'created'):
+        if m.entry_id not in ret:
+            image = m.get_image()
+            if image:
+                ret[m.entry_id] = image
+    return ret
 
 
 def update_media_order_for_entry(entry_id, order_list):
@@ -403,6 +496,55 @@ def get_type_for_mime_type(mime_type):
         return OTHER_TYPE
 
 
+def get_storage_usage(user):
+    size = StorageUsage.objects.filter(user=user).values_list('size', flat=True).first()
+    if size is None:
+        size = reconcile_storage_usage(user)
+    return size
+
+
+def _get_file_size(storage, name):
+    try:
+        return storage.size(name) if name else 0
+    except OSError:
+        return 0
+
+
+def update_storage_usage(user, delta):
+    # a missing ledger is initialised from the file system when it is read,
+    # which then already contains the change. It must not be created here,
+    # since media are also deleted when their owner is deleted
+    if delta:
+        StorageUsage.objects.filter(user=user).update(size=F('size') + delta)
+
+
+def reconcile_storage_usage(user):
+    with transaction.atomic():
+        usage, _created = StorageUsage.objects.select_for_update().get_or_create(
+            user=user
+        )
+        size = get_directory_size(get_user_storage_path(user.username))
+        if usage.reconciled is not None and usage.size != size:
+            logger.warning(
+                'Storage usage of %s drifted by %s bytes',
+                user.username,
+                size - usage.size,
+            )
+        usage.size = size
+        usage.reconciled = timezone.now()
+        usage.save()
+    return size
+
+
+def reconcile_all_storage_usage():
+    User = get_user_model()
+    users = User.objects.filter(
+        Q(media__isnull=False) | Q(storage_usage__isnull=False)
+    ).distinct()
+    for user in users.iterator():
+        reconcile_storage_usage(user)
+
+
 def repair():
     for m in Media.objects.filter(status__in=[STATUS_NOT_CONVERTED, STATUS_ERROR]):
         m.status = STATUS_NOT_CONVERTED
@@ -419,9 +561,30 @@ def repair():
 # Signal handling
 
 
+@receiver(pre_save, sender=Media, dispatch_uid='media_pre_save')
+def media_pre_save(sender, instance, update_fields=None, *args, **kwargs):
+    # remember the size of a replaced file, which is deleted by django_cleanup
+    instance._previous_file_size = None
+    if instance._state.adding or (
+        update_fields is not None and 'file' not in update_fields
+    ):
+        return
+    previous = (
+        sender.objects.filter(pk=instance.pk).values_list('file', flat=True).first()
+    )
+    if previous and previous != instance.file.name:
+        instance._previous_file_size = _get_file_size(instance.file.storage, previous)
+
+
 @receiver(post_save, sender=Media, dispatch_uid='media_post_save')
 def media_post_save(sender, instance, created, *args, **kwargs):
+    invalidate_user_data([instance.owner.username])
+    if getattr(instance, '_previous_file_size', None) is not None:
+        update_storage_usage(
+            instance.owner, instance.file.size - instance._previous_file_size
+        )
     if created:
+        update_storage_usage(instance.owner, instance.file.size)
         if instance.type == VIDEO_TYPE:
             queue = django_rq.get_queue('video')
             with transaction.atomic():
@@ -455,6 +618,8 @@ def media_post_save(sender, instance, created, *args, **kwargs):
 
 @receiver(pre_delete, sender=Media, dispatch_uid='media_pre_delete')
 def media_pre_delete(sender, instance, *args, **kwargs):
+    # the original is deleted by django_cleanup after the media is deleted
+    instance._file_size = _get_file_size(instance.file.storage, instance.file.name)
     try:
         conn = django_rq.get_connection()
         job = Job.fetch(instance.get_job_id(), connection=conn)
@@ -470,10 +635,17 @@ def media_pre_delete(sender, instance, *args, **kwargs):
 
 @receiver(post_delete, sender=Media, dispatch_uid='media_post_delete')
 def media_post_delete(sender, instance, *args, **kwargs):
+    invalidate_user_data([instance.owner.username])
+    path = instance.get_protected_assets_path()
+    size = get_directory_size(path)
     try:
-        shutil.rmtree(instance.get_protected_assets_path())
+        shutil.rmtree(path)
     except FileNotFoundError:
         pass
+    file_size = getattr(instance, '_file_size', None)
+    if file_size is None:
+        file_size = _get_file_size(instance.file.storage, instance.file.name)
+    update_storage_usage(instance.owner, -(size + file_size))
 
 
 @receiver(post_delete, sender=Entry, dispatch_uid='entry_post_delete')
@@ -24,31 +24,68 @@ mkdir -p ${target}
 
 source="${source}[0]"
 
-convert "${source}" -auto-orient -background white -alpha remove -alpha off -thumbnail 400x300^ -gravity center -extent 400x300 "${target}/tn.jpg"
+# the source is decoded only once into a pixel cache, which all further steps
+# read without decoding it again
+tmp=$(mktemp -d)
+trap 'rm -rf "${tmp}"' EXIT
+cache="${tmp}/source.mpc"
 
-width=$(identify -format "%[fx:w]" "${source}")
+stage_start=$(date +%s%N)
 
-if $(identify -format '%[opaque]' "${source}"); then
+timing() {
+  local now
+  now=$(date +%s%N)
+  echo "${1}: $(( (now - stage_start) / 1000000 )) ms"
+  stage_start=${now}
+}
+
+convert "${source}" -auto-orient "${cache}"
+timing "decode"
+
+info=$(identify -format "%[fx:w] %[opaque]" "${cache}")
+read -r width opaque <<< "${info}"
+
+if [[ "${opaque,,}" == "true" ]]; then
   filetype="jpg"
 else
   filetype="png"
 fi
+timing "identify"
 
-previewtxt="${target}/preview.txt"
-
-> ${previewtxt}
+convert "${cache}" -background white -alpha remove -alpha off -thumbnail 400x300^ -gravity center -extent 400x300 "${target}/tn.jpg"
+timing "thumbnail"
 
+previews=()
 for resolution in "${resolutions[@]}"; do
   if [[ width -lt resolution ]]; then
-    outfile="preview-${width}.${filetype}"
-    convert "${source}" -auto-orient -adaptive-resize ${resolution}\> "${target}/$outfile"
-    echo "${width},${outfile}" >> ${previewtxt}
+    previews+=("${width}")
     break
   else
-    outfile="preview-${resolution}.${filetype}"
-    convert "${source}" -auto-orient -adaptive-resize ${resolution} "${target}/$outfile"
-    echo "${resolution},${outfile}" >> ${previewtxt}
+    previews+=("${resolution}")
+  fi
+done
+
+# create the previews from the largest to the smallest one, each one is
+# downscaled from the previous one
+args=("${cache}")
+for (( i=${#previews[@]}-1; i>=0; i-- )); do
+  resolution="${previews[i]}"
+  if [[ resolution -lt width ]]; then
+    args+=(-adaptive-resize "${resolution}")
   fi
+  args+=(-write "${target}/preview-${resolution}.${filetype}")
+done
+args+=(null:)
+
+convert "${args[@]}"
+timing "previews"
+
+previewtxt="${target}/preview.txt"
+
+> ${previewtxt}
+
+for resolution in "${previews[@]}"; do
+  echo "${resolution},preview-${resolution}.${filetype}" >> ${previewtxt}
 done
 
 echo "Done - thumbnail is at ${target}/"
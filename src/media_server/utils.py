@@ -34,14 +34,24 @@ def get_free_space_for_user(user):
     return max(get_quota_for_user(user) - get_used_space_for_user(user), 0)
 
 
-def get_used_space_for_user(user):
-    path = os.path.join(settings.PROTECTED_MEDIA_ROOT, user_hash(user.username))
+def get_user_storage_path(username):
+    return os.path.join(settings.PROTECTED_MEDIA_ROOT, user_hash(username))
+
+
+def get_directory_size(path):
     size = 0
     for root, _dirs, files in os.walk(path):
         size += sum(os.path.getsize(os.path.join(root, name)) for name in files)
     return size
 
 
+def get_used_space_for_user(user):
+    # imported here, since the models depend on this module
+    from .models import get_storage_usage
+
+    return get_storage_usage(user)
+
+
 def check_quota(user, size):
     if get_used_space_for_user(user) + size < get_quota_for_user(user):
         return True
@@ -486,6 +486,16 @@ VOC_ID = 'povoc'
 VOC_GRAPH = 'http://base.uni-ak.ac.at/portfolio/vocabulary/'
 LANGUAGES_VOCID = 'languages'
 
+VOCABULARY_MIRROR_PATH = env.str(
+    'VOCABULARY_MIRROR_PATH',
+    default=os.path.join(BASE_DIR, 'assets', 'vocabulary', 'mirror.json'),
+)
+
+SCHEMA_SNAPSHOT_PATH = env.str(
+    'SCHEMA_SNAPSHOT_PATH',
+    default=os.path.join(BASE_DIR, 'assets', 'vocabulary', 'schemas.json'),
+)
+
 EN_LABELS_TITLE_CASE = env.bool('EN_LABELS_TITLE_CASE', default=True)
 
 ANGEWANDTE_API_KEY = env.str('ANGEWANDTE_API_KEY', default='')